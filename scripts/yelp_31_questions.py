@@ -23,6 +23,8 @@ Optional performance knobs (recommended for laptops)
   # By default this script processes the full dataset; use caps to speed it up.
   python3 -u scripts/yelp_fancy_figures.py --max-reviews 200000 --max-users 200000 --max-tips 200000
   python3 -u scripts/yelp_fancy_figures.py --no-checkins
+  python3 -u scripts/yelp_fancy_figures.py --no-distributions   # business ranking charts only
+  python3 -u scripts/yelp_fancy_figures.py --jobs 8             # more parser processes (uncapped files are sharded)
 
 Outputs
 - PNGs: 01_*.png, 02_*.png, ...
@@ -32,6 +34,9 @@ Notes
 - The Yelp JSON files are JSONL: one JSON object per line.
 - Some business fields (like `hours` or `attributes`) can be missing; charts that depend on them
   will be skipped automatically.
+- Check-in/review/user/tip files are copied to the temp dir (TMPDIR) and parsed in worker
+  processes while the archive keeps streaming; charts are drawn once their file is parsed.
+- Charts are built in the main process and rendered to PNG by the same worker pool (`--jobs`).
 
 """
 
@@ -47,16 +52,22 @@ os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
 os.environ.setdefault("MKL_THREADING_LAYER", "SEQ")
 
 import argparse
-import json
-import math
+import io
+import multiprocessing
+import pickle
+import re
+import shutil
+import sys
 import tarfile
+import tempfile
 import zipfile
 from array import array
-from collections import Counter, defaultdict
-from dataclasses import dataclass
+from collections import Counter, deque
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Sequence
 
 import matplotlib
 
@@ -64,13 +75,42 @@ import matplotlib
 # (e.g., WSL/containers/CI) without requiring Qt/X11.
 matplotlib.use("Agg")
 
+import matplotlib.colors as mcolors
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
 import seaborn as sns
 
+try:
+    # orjson parses raw bytes in C and is several times faster than stdlib json
+    # on the multi-GB review/user files; ujson is the next-best C parser.
+    # Fall back to json when neither is installed.
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        from json import loads as _json_loads
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    # ISA-L's SIMD inflate is 2–4x faster than zlib on the multi-GB tar stream; the threaded
+    # reader also moves it off the main thread so inflating overlaps tar/spool work.
+    from isal import igzip as _gzip
+    from isal import igzip_threaded as _gzip_threaded
+except ImportError:
+    import gzip as _gzip
+
+    _gzip_threaded = None
+
 
 # ----------------------------
 # Small utilities
@@ -145,18 +185,100 @@ def _split_categories(categories_field: object) -> list[str]:
     return [c.strip() for c in text.split(",") if c.strip()]
 
 
-def _iter_jsonl_dicts(fileobj) -> Iterable[dict]:
-    for raw_line in fileobj:
-        if not raw_line:
-            return
-        line = raw_line.decode("utf-8", errors="strict").strip()
-        if not line:
+_READ_BUFFER_SIZE = 1 << 20
+
+
+# Plain (unescaped, unpadded) business_id value on a raw JSONL line. Ids that do not
+# match this shape fall through to the full parse and the normal str check.
+_BUSINESS_ID_RE = re.compile(rb'"business_id":\s*"([^"\\\s]+)"')
+
+
+def _iter_jsonl_dicts(fileobj, business_ids: frozenset[bytes] | None = None) -> Iterable[dict]:
+    # Both loaders accept the raw line bytes (trailing newline included), so we skip
+    # the per-line decode/strip. The large buffer turns many small reads from the
+    # tar/gzip stream into a few bulk ones.
+    # With `business_ids`, lines whose raw business_id is not in the set are dropped
+    # before JSON decoding; with narrow filters that is most of the review/tip file.
+    search_id = _BUSINESS_ID_RE.search
+    for raw_line in io.BufferedReader(fileobj, buffer_size=_READ_BUFFER_SIZE):
+        if raw_line.isspace():
             continue
-        obj = json.loads(line)
+        if business_ids is not None:
+            m = search_id(raw_line)
+            if m is not None and m.group(1) not in business_ids:
+                continue
+        obj = _json_loads(raw_line)
         if isinstance(obj, dict):
             yield obj
 
 
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+def _scan_businesses_polars(
+    fileobj,
+    *,
+    states: frozenset[str],
+    cities: frozenset[str],
+    category_substrings: list[str],
+) -> "pl.DataFrame":
+    """
+    `--backend polars`: parse + filter the business JSONL with Polars' multi-threaded reader.
+    Returns one row per selected business with the same normalized columns the Python loop
+    builds (`categories` is a list column of stripped category names).
+    """
+    schema = {
+        "business_id": pl.String,
+        "city": pl.String,
+        "state": pl.String,
+        "categories": pl.String,
+        "stars": pl.Float64,
+        "review_count": pl.Int64,
+        "latitude": pl.Float64,
+        "longitude": pl.Float64,
+        "is_open": pl.Int64,
+        "attributes": pl.Struct({"RestaurantsPriceRange2": pl.String}),
+        "hours": pl.Struct({day: pl.String for day in _WEEKDAYS}),
+    }
+    lf = pl.scan_ndjson(fileobj.read(), schema=schema).with_columns(
+        pl.col("state").str.strip_chars().str.to_uppercase().fill_null(""),
+        pl.col("city").str.strip_chars().fill_null(""),
+    )
+    if states:
+        lf = lf.filter(pl.col("state").is_in(list(states)))
+    if cities:
+        lf = lf.filter(pl.col("city").str.to_lowercase().is_in(list(cities)))
+    if category_substrings:
+        categories_lower = pl.col("categories").str.to_lowercase().fill_null("")
+        lf = lf.filter(pl.any_horizontal([categories_lower.str.contains(sub, literal=True) for sub in category_substrings]))
+
+    price = (
+        pl.col("attributes").struct.field("RestaurantsPriceRange2")
+        .str.strip_chars()
+        .cast(pl.Float64, strict=False)
+        .cast(pl.Int64, strict=False)
+    )
+    return lf.select(
+        pl.col("business_id").str.strip_chars().fill_null(""),
+        pl.col("city"),
+        pl.col("state"),
+        pl.col("stars").cast(pl.Float32),
+        pl.col("review_count").fill_null(0).cast(pl.UInt32),
+        pl.col("latitude"),
+        pl.col("longitude"),
+        pl.col("is_open").fill_null(0).cast(pl.UInt8),
+        pl.col("categories")
+        .str.split(",")
+        .list.eval(pl.element().str.strip_chars().filter(pl.element().str.strip_chars() != ""))
+        .fill_null([]),
+        pl.sum_horizontal(pl.col("hours").struct.field(day).is_not_null() for day in _WEEKDAYS)
+        .fill_null(0)
+        .cast(pl.UInt8)
+        .alias("days_open"),
+        pl.when(price.is_between(0, 127)).then(price).otherwise(-1).cast(pl.Int8).alias("price_range"),
+    ).collect()
+
+
 # ----------------------------
 # Reading Yelp-JSON.zip (tar.gz inside zip)
 # ----------------------------
@@ -179,26 +301,462 @@ def _iter_tar_members_from_zip(zip_path: Path) -> tarfile.TarFile:
         raise
 
     # Yelp-JSON.zip contains a gzip stream named *.tar (effectively a .tar.gz).
-    tf = tarfile.open(fileobj=tar_gz_stream, mode="r|gz")
+    # Inflate it ourselves (isal when available, on a reader thread) and let tarfile read plain tar.
+    if _gzip_threaded is not None:
+        gz_stream = _gzip_threaded.open(tar_gz_stream, "rb", threads=1, block_size=_READ_BUFFER_SIZE)
+    else:
+        gz_stream = _gzip.GzipFile(fileobj=tar_gz_stream, mode="rb")
+    tf = tarfile.open(fileobj=gz_stream, mode="r|", bufsize=_READ_BUFFER_SIZE)
 
     # Attach closers so callers can close a single handle.
     tf._codex_zip_file = zip_file  # type: ignore[attr-defined]
     tf._codex_tar_gz_stream = tar_gz_stream  # type: ignore[attr-defined]
+    tf._codex_gz_stream = gz_stream  # type: ignore[attr-defined]
     return tf
 
 
 def _close_tar_chain(tf: tarfile.TarFile) -> None:
+    gz_stream = getattr(tf, "_codex_gz_stream", None)
     tar_stream = getattr(tf, "_codex_tar_gz_stream", None)
     zip_file = getattr(tf, "_codex_zip_file", None)
     try:
         tf.close()
     finally:
+        if gz_stream is not None:
+            gz_stream.close()
         if tar_stream is not None:
             tar_stream.close()
         if zip_file is not None:
             zip_file.close()
 
 
+# ----------------------------
+# Per-file parsers (run in worker processes)
+# ----------------------------
+
+@dataclass
+class CheckinStats:
+    matrix: np.ndarray  # (7, 24) day-of-week × hour
+    total: int
+
+
+@dataclass
+class ReviewStats:
+    month_counts: Counter[str]
+    stars: array  # 1–5, or 0 when out of range
+    lengths: array
+    useful: array
+    funny: array
+    cool: array
+    counted: int
+
+
+@dataclass
+class UserStats:
+    join_year_counts: Counter[int]
+    review_counts: array
+    fans_counts: array
+    avg_stars: array
+    counted: int
+
+
+@dataclass
+class TipStats:
+    month_counts: Counter[str]
+    compliments: array
+    counted: int
+
+
+@dataclass
+class PhotoStats:
+    label_counts: Counter[str]
+    counted: int
+
+
+_KEY_BATCH = 1 << 18
+
+
+def _valid_periods(counts: Counter[str], fmt: str) -> Counter[str]:
+    """
+    Keep only period keys (sliced "YYYY-MM" / "YYYY" prefixes of ISO dates) that parse with
+    `fmt`. Slicing replaces per-row date parsing, so malformed dates are dropped here — once
+    per distinct key rather than once per row.
+    """
+    valid: Counter[str] = Counter()
+    for key, n in counts.items():
+        try:
+            datetime.strptime(key, fmt)
+        except ValueError:
+            continue
+        valid[key] = n
+    return valid
+
+
+def _checkin_cell_counts(timestamps: list[str]) -> np.ndarray:
+    """
+    Bulk-parse "YYYY-MM-DD HH:MM:SS" check-in timestamps and count them per
+    day-of-week × hour cell (flat, length 168). Unparseable timestamps are dropped.
+    """
+    # NumPy also accepts short years ("209-11-03"); keep fromisoformat's 4-digit-year rule.
+    timestamps = [t for t in timestamps if t[4:5] == "-"]
+    try:
+        ts = np.array(timestamps, dtype="datetime64[s]")
+    except ValueError:
+        ts = np.array([_to_datetime64(t) for t in timestamps], dtype="datetime64[s]")
+    hours = ts[~np.isnat(ts)].astype("datetime64[h]").astype(np.int64)
+    weekday = (hours // 24 + 3) % 7  # 1970-01-01 was a Thursday; Monday = 0
+    return np.bincount(weekday * 24 + hours % 24, minlength=7 * 24)
+
+
+def _to_datetime64(text: str) -> np.datetime64:
+    try:
+        return np.datetime64(datetime.fromisoformat(text), "s")
+    except ValueError:
+        return np.datetime64("NaT", "s")
+
+
+def _encode_ids(business_ids: frozenset[str]) -> frozenset[bytes]:
+    return frozenset(b.encode() for b in business_ids)
+
+
+def _parse_checkins(fileobj, business_ids: frozenset[str], limit: int) -> CheckinStats:
+    cells = np.zeros(7 * 24, dtype=np.int64)
+    timestamps: list[str] = []
+    for c in _iter_jsonl_dicts(fileobj, _encode_ids(business_ids)):
+        business_id = _normalize_str(c.get("business_id"))
+        if business_id not in business_ids:
+            continue
+        date_field = _normalize_str(c.get("date"))
+        if not date_field:
+            continue
+        # Each entry is "YYYY-MM-DD HH:MM:SS" separated by comma+space
+        timestamps.extend(date_field.split(", "))
+        if len(timestamps) >= _KEY_BATCH:
+            cells += _checkin_cell_counts(timestamps)
+            timestamps.clear()
+    if timestamps:
+        cells += _checkin_cell_counts(timestamps)
+    return CheckinStats(cells.reshape(7, 24), int(cells.sum()))
+
+
+def _non_negative_int(value: object) -> int:
+    """Slow path for count fields that are not already a non-negative int (None, "3", 2.0, ...)."""
+    return max(0, int(value or 0))
+
+
+# The per-row loops below bind `row.get` and the buffer appends to locals and take an
+# `x.__class__ is int` / `is str` fast path before falling back to the general coercions.
+
+
+def _parse_reviews(fileobj, business_ids: frozenset[str], limit: int) -> ReviewStats:
+    month_counts: Counter[str] = Counter()
+    star_values = array("B")
+    lengths = array("I")
+    useful = array("I")
+    funny = array("I")
+    cool = array("I")
+    month_keys: list[str] = []
+    add_month, add_star, add_length = month_keys.append, star_values.append, lengths.append
+    add_useful, add_funny, add_cool = useful.append, funny.append, cool.append
+    counted = 0
+    for r in _iter_jsonl_dicts(fileobj, _encode_ids(business_ids)):
+        get = r.get
+        business_id = get("business_id")
+        if business_id.__class__ is not str or business_id not in business_ids:
+            if _normalize_str(business_id) not in business_ids:
+                continue
+
+        date_field = get("date")
+        date_field = date_field.strip() if date_field.__class__ is str else _normalize_str(date_field)
+        if not date_field:
+            continue
+        # ISO dates: the "YYYY-MM" prefix is the month bucket.
+        add_month(date_field[:7])
+        if len(month_keys) >= _KEY_BATCH:
+            month_counts.update(month_keys)
+            month_keys.clear()
+
+        stars = get("stars", 0)
+        if stars.__class__ is not int:
+            stars = int(stars or 0)
+        add_star(stars if 1 <= stars <= 5 else 0)
+        text = get("text")
+        add_length(len(text.strip() if text.__class__ is str else _normalize_str(text)))
+
+        v = get("useful", 0)
+        add_useful(v if v.__class__ is int and v >= 0 else _non_negative_int(v))
+        v = get("funny", 0)
+        add_funny(v if v.__class__ is int and v >= 0 else _non_negative_int(v))
+        v = get("cool", 0)
+        add_cool(v if v.__class__ is int and v >= 0 else _non_negative_int(v))
+
+        counted += 1
+        if limit > 0 and counted >= limit:
+            break
+    month_counts.update(month_keys)
+    month_counts = _valid_periods(month_counts, "%Y-%m")
+    return ReviewStats(month_counts, star_values, lengths, useful, funny, cool, counted)
+
+
+def _parse_users(fileobj, business_ids: frozenset[str], limit: int) -> UserStats:
+    join_years: Counter[str] = Counter()
+    review_counts = array("I")
+    fans_counts = array("I")
+    avg_stars = array("f")
+    year_keys: list[str] = []
+    add_year, add_review_count, add_fans, add_avg = year_keys.append, review_counts.append, fans_counts.append, avg_stars.append
+    counted = 0
+    for u in _iter_jsonl_dicts(fileobj):
+        get = u.get
+        ys = get("yelping_since")
+        ys = ys.strip() if ys.__class__ is str else _normalize_str(ys)
+        if ys:
+            add_year(ys[:4])
+            if len(year_keys) >= _KEY_BATCH:
+                join_years.update(year_keys)
+                year_keys.clear()
+
+        v = get("review_count", 0)
+        add_review_count(v if v.__class__ is int and v >= 0 else _non_negative_int(v))
+        v = get("fans", 0)
+        add_fans(v if v.__class__ is int and v >= 0 else _non_negative_int(v))
+        v = get("average_stars")
+        add_avg(v if v.__class__ is float else _safe_float(v))
+
+        counted += 1
+        if limit > 0 and counted >= limit:
+            break
+    join_years.update(year_keys)
+    join_year_counts = Counter({int(year): n for year, n in _valid_periods(join_years, "%Y").items()})
+    return UserStats(join_year_counts, review_counts, fans_counts, avg_stars, counted)
+
+
+def _parse_tips(fileobj, business_ids: frozenset[str], limit: int) -> TipStats:
+    month_counts: Counter[str] = Counter()
+    compliments = array("I")
+    month_keys: list[str] = []
+    add_month, add_compliments = month_keys.append, compliments.append
+    counted = 0
+    for t in _iter_jsonl_dicts(fileobj, _encode_ids(business_ids)):
+        get = t.get
+        business_id = get("business_id")
+        if business_id.__class__ is not str or business_id not in business_ids:
+            business_id = _normalize_str(business_id)
+            if business_id not in business_ids:
+                continue
+        if not business_id:
+            continue
+        date_field = get("date")
+        date_field = date_field.strip() if date_field.__class__ is str else _normalize_str(date_field)
+        if date_field:
+            add_month(date_field[:7])
+            if len(month_keys) >= _KEY_BATCH:
+                month_counts.update(month_keys)
+                month_keys.clear()
+        v = get("compliment_count", 0)
+        add_compliments(v if v.__class__ is int and v >= 0 else _non_negative_int(v))
+        counted += 1
+        if limit > 0 and counted >= limit:
+            break
+    month_counts.update(month_keys)
+    month_counts = _valid_periods(month_counts, "%Y-%m")
+    return TipStats(month_counts, compliments, counted)
+
+
+def _parse_photos(fileobj, business_ids: frozenset[str], limit: int) -> PhotoStats:
+    label_counts: Counter[str] = Counter()
+    counted = 0
+    for p in _iter_jsonl_dicts(fileobj, _encode_ids(business_ids)):
+        business_id = _normalize_str(p.get("business_id"))
+        if not business_id or business_id not in business_ids:
+            continue
+        label_counts[_normalize_str(p.get("label")) or "Unknown"] += 1
+        counted += 1
+        if counted >= limit:
+            break
+    return PhotoStats(label_counts, counted)
+
+
+_MEMBER_PARSERS = {
+    "checkin": _parse_checkins,
+    "review": _parse_reviews,
+    "user": _parse_users,
+    "tip": _parse_tips,
+    "photo": _parse_photos,
+}
+
+
+def _spool_member(tf: tarfile.TarFile, member: tarfile.TarInfo, spool_dir: str) -> str:
+    """Copy one tar member to a temp file so a worker can parse it while the tar stream moves on."""
+    fileobj = tf.extractfile(member)
+    if fileobj is None:
+        raise RuntimeError(f"Failed to read {member.name} from archive.")
+    fd, path = tempfile.mkstemp(dir=spool_dir, suffix=".json")
+    with fileobj, os.fdopen(fd, "wb") as out:
+        shutil.copyfileobj(fileobj, out, _READ_BUFFER_SIZE)
+    return path
+
+
+def _parse_spooled(kind: str, path: str, business_ids: frozenset[str], limit: int) -> Any:
+    """Worker entry point: parse one spooled member, then delete its temp file."""
+    try:
+        with open(path, "rb", buffering=0) as fileobj:
+            return _MEMBER_PARSERS[kind](fileobj, business_ids, limit)
+    finally:
+        os.unlink(path)
+
+
+def _parse_reviews_polars(path: str, business_ids: frozenset[str], limit: int) -> ReviewStats:
+    """
+    `--backend polars`: the review pass as one Polars query (compiled NDJSON reader + columnar
+    filter/reductions) instead of the per-row loop. Same normalization as `_parse_reviews`.
+    """
+    schema = {
+        "business_id": pl.String,
+        "stars": pl.Float64,
+        "useful": pl.Int64,
+        "funny": pl.Int64,
+        "cool": pl.Int64,
+        "text": pl.String,
+        "date": pl.String,
+    }
+    lf = (
+        pl.scan_ndjson(path, schema=schema)
+        .with_columns(pl.col("date").str.strip_chars().fill_null(""))
+        .filter(pl.col("business_id").str.strip_chars().fill_null("").is_in(list(business_ids)) & (pl.col("date") != ""))
+    )
+    if limit > 0:
+        lf = lf.head(limit)
+    stars = pl.col("stars").fill_null(0).cast(pl.Int64)
+    votes = [pl.col(c).fill_null(0).clip(lower_bound=0).cast(pl.UInt32) for c in ("useful", "funny", "cool")]
+    df = lf.select(
+        pl.col("date").str.slice(0, 7).alias("month"),
+        pl.when(stars.is_between(1, 5)).then(stars).otherwise(0).cast(pl.UInt8).alias("stars"),
+        pl.col("text").str.strip_chars().str.len_chars().fill_null(0).cast(pl.UInt32).alias("length"),
+        *votes,
+    ).collect()
+
+    def buffer(typecode: str, column: str) -> array:
+        out = array(typecode)
+        out.frombytes(df[column].to_numpy().tobytes())
+        return out
+
+    month_counts = _valid_periods(Counter(dict(df["month"].value_counts().iter_rows())), "%Y-%m")
+    return ReviewStats(
+        month_counts,
+        buffer("B", "stars"),
+        buffer("I", "length"),
+        buffer("I", "useful"),
+        buffer("I", "funny"),
+        buffer("I", "cool"),
+        df.height,
+    )
+
+
+_POLARS_PARSERS = {
+    "review": _parse_reviews_polars,
+}
+
+
+def _parse_spooled_polars(kind: str, path: str, business_ids: frozenset[str], limit: int) -> Any:
+    """Worker entry point for `--backend polars`: Polars reads the spooled file by path."""
+    try:
+        return _POLARS_PARSERS[kind](path, business_ids, limit)
+    finally:
+        os.unlink(path)
+
+# Files smaller than this are parsed by a single worker.
+_MIN_SHARD_BYTES = 1 << 26
+
+
+class _FileRange(io.RawIOBase):
+    """Unbuffered reader over bytes [start, end) of a file."""
+
+    def __init__(self, path: str, start: int, end: int) -> None:
+        super().__init__()
+        self._file = open(path, "rb", buffering=0)
+        self._file.seek(start)
+        self._left = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._left <= 0:
+            return 0
+        n = self._file.readinto(memoryview(buffer)[: self._left]) or 0
+        self._left -= n
+        return n
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def _shard_ranges(path: str, n_shards: int) -> list[tuple[int, int]]:
+    """Split a JSONL file into up to `n_shards` byte ranges that start and end on line boundaries."""
+    size = os.path.getsize(path)
+    n_shards = max(1, min(n_shards, size // _MIN_SHARD_BYTES))
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, n_shards):
+            f.seek(max(size * i // n_shards, bounds[-1]))
+            f.readline()
+            bounds.append(f.tell())
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _parse_shard(kind: str, path: str, start: int, end: int, business_ids: frozenset[str]) -> Any:
+    """Worker entry point: parse one byte range of a spooled member (no row limit)."""
+    with _FileRange(path, start, end) as fileobj:
+        return _MEMBER_PARSERS[kind](fileobj, business_ids, -1)
+
+
+def _merge_stats(parts: list[Any]) -> Any:
+    """Combine per-shard stats (given in file order) field by field."""
+    merged = parts[0]
+    for part in parts[1:]:
+        for field in fields(merged):
+            value = getattr(merged, field.name)
+            other = getattr(part, field.name)
+            if isinstance(value, Counter):
+                value.update(other)
+            elif isinstance(value, array):
+                value.extend(other)
+            else:
+                setattr(merged, field.name, value + other)
+    return merged
+
+
+class _ShardedJob:
+    """Shards of one spooled member in flight on the pool; `get()` merges them and deletes the file."""
+
+    def __init__(self, pool, kind: str, path: str, business_ids: frozenset[str], n_shards: int) -> None:
+        self._path = path
+        self._jobs = [
+            pool.apply_async(_parse_shard, (kind, path, start, end, business_ids))
+            for start, end in _shard_ranges(path, n_shards)
+        ]
+
+    def get(self) -> Any:
+        try:
+            return _merge_stats([job.get() for job in self._jobs])
+        finally:
+            os.unlink(self._path)
+
+
+def _submit_spooled(pool, kind: str, path: str, business_ids: frozenset[str], limit: int, jobs: int):
+    """
+    Queue a spooled member on the worker pool. Uncapped files are split into byte-range
+    shards across the workers; capped files keep a single in-order pass so the first
+    `limit` rows are the ones counted.
+    """
+    if limit < 0 and jobs > 1:
+        return _ShardedJob(pool, kind, path, business_ids, jobs)
+    return pool.apply_async(_parse_spooled, (kind, path, business_ids, limit))
+
+
 # ----------------------------
 # Filters / geography helpers
 # ----------------------------
@@ -224,26 +782,6 @@ def _country_for_state_code(state_code: str) -> str:
     return "Other/Unknown"
 
 
-def _business_passes_filters(
-    business: dict,
-    *,
-    states: set[str],
-    cities: set[str],
-    category_substrings: list[str],
-) -> bool:
-    state = _normalize_str(business.get("state")).upper()
-    city = _normalize_str(business.get("city")).lower()
-
-    categories_str = _normalize_str(business.get("categories")).lower()
-    if states and state not in states:
-        return False
-    if cities and city not in cities:
-        return False
-    if category_substrings and not any(s in categories_str for s in category_substrings):
-        return False
-    return True
-
-
 # ----------------------------
 # Plotting helpers (prettier defaults)
 # ----------------------------
@@ -293,16 +831,83 @@ def _apply_theme() -> None:
     )
 
 
-def _plot_and_save(fig: plt.Figure, out_dir: Path, spec: ChartSpec) -> ChartSpec:
+# One Figure per figsize, cleared and reused between charts instead of rebuilt each time.
+# They are plain Agg-canvas Figures, not registered with pyplot's figure manager.
+_FIGURES: dict[tuple[float, float], Figure] = {}
+
+# Charts are built on the main thread, then pickled to the worker pool (see `main`), which does
+# the 300-dpi Agg render and PNG encode while the main thread moves on to the next chart.
+_RENDER: dict[str, Any] = {"pool": None}
+_SAVES: deque[Any] = deque()
+
+
+def _get_fig(figsize: tuple[float, float]) -> tuple[Figure, plt.Axes]:
+    fig = _FIGURES.get(figsize)
+    if fig is None:
+        fig = _FIGURES[figsize] = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    else:
+        fig.clear()
+    return fig, fig.add_subplot()
+
+
+def _wait_for_saves() -> None:
+    """Block until every queued PNG is written; re-raises the first save error."""
+    while _SAVES:
+        _SAVES.popleft().get()
+
+
+def _close_figures() -> None:
+    # Unfinished renders are abandoned with the pool (normal exits wait in _wait_for_saves).
+    _SAVES.clear()
+    _FIGURES.clear()
+
+
+def _render_png(payload: bytes, out_path: Path) -> None:
+    """Worker entry point: unpickle one chart and write it as a PNG."""
+    fig = pickle.loads(payload)
+    FigureCanvasAgg(fig)  # unpickled figures get a bare canvas; lay out on Agg as _get_fig figures do
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=300, bbox_inches="tight")
+
+
+def _plot_and_save(fig: Figure, out_dir: Path, spec: ChartSpec) -> ChartSpec:
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / spec.filename
     sns.despine(fig=fig)
-    fig.tight_layout()
-    fig.savefig(out_path, dpi=300, bbox_inches="tight")
-    plt.close(fig)
+    payload = pickle.dumps(fig, protocol=pickle.HIGHEST_PROTOCOL)
+    fig.clear()  # kept for reuse by _get_fig
+    pool = _RENDER["pool"]
+    if pool is None:
+        _render_png(payload, out_path)
+    else:
+        _SAVES.append(pool.apply_async(_render_png, (payload, out_path)))
     return spec
 
 
+def _write_csv(df: pd.DataFrame, path: Path) -> None:
+    """
+    `df.to_csv(path, index=False)`, through Polars' native CSV writer when it is installed
+    (~10x faster on the business table). Missing values are written as empty fields either way.
+    """
+    if pl is None:
+        df.to_csv(path, index=False)
+        return
+    columns = []
+    for name, col in df.items():
+        if isinstance(col.dtype, np.dtype) and col.dtype.kind in "biuf":
+            values = pl.Series(name, col.to_numpy())
+            if values.dtype.is_float():
+                values = values.fill_nan(None)
+        elif pd.api.types.is_integer_dtype(col.dtype):  # nullable Int*
+            values = pl.Series(name, col.to_numpy(dtype=np.float64, na_value=np.nan)).fill_nan(None).cast(pl.Int64)
+        else:
+            # Text/categorical; empty strings become nulls so they are written bare (pandas style), not as "".
+            values = pl.Series(name, col.astype(object).where(col.notna(), None).to_numpy(), dtype=pl.String).replace("", None)
+        columns.append(values)
+    pl.DataFrame(columns).write_csv(path)
+
+
 def _write_manifest(out_dir: Path, specs: list[ChartSpec], context_lines: list[str]) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
     manifest_path = out_dir / "manifest.md"
@@ -320,7 +925,13 @@ def _write_manifest(out_dir: Path, specs: list[ChartSpec], context_lines: list[s
     manifest_path.write_text("\n".join(lines), encoding="utf-8")
 
 
-def _barh_with_value_labels(ax: plt.Axes, labels: list[str], values: list[float], *, colors: list[tuple[float, float, float]] | None = None) -> None:
+@lru_cache(maxsize=64)
+def _palette(name: str, n_colors: int) -> tuple[tuple[float, float, float], ...]:
+    """Seaborn palette, cached per (name, size); a tuple so cached colors can't be mutated."""
+    return tuple(sns.color_palette(name, n_colors=n_colors))
+
+
+def _barh_with_value_labels(ax: plt.Axes, labels: list[str], values: list[float], *, colors: Sequence[tuple[float, float, float]] | None = None) -> None:
     y = np.arange(len(labels))
     bars = ax.barh(y, values, color=colors)
     ax.set_yticks(y, labels=labels)
@@ -347,27 +958,123 @@ def _format_large_number_axis(ax: plt.Axes, axis: str = "x") -> None:
         ax.yaxis.set_major_formatter(fmt)
 
 
-def _box_stats(data: np.ndarray, *, label: str, whis_q: tuple[float, float] = (0.05, 0.95)) -> dict[str, Any]:
+def _hist_bars(ax: plt.Axes, counts: np.ndarray, edges: np.ndarray, **kwargs: Any) -> Any:
+    """
+    Draw precomputed histogram counts (from np.histogram / np.bincount) as edge-aligned bars.
+    Cheaper than handing the raw column to seaborn/Matplotlib, which re-bin it themselves.
+    """
+    return ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge", **kwargs)
+
+
+def _blank_rate(values: pd.Series) -> float:
+    """Share of entries that are empty/whitespace-only strings (strip test runs once per category)."""
+    if not len(values):
+        return float("nan")
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        blank = np.fromiter((not str(c).strip() for c in values.cat.categories), dtype=bool, count=len(values.cat.categories))
+        codes = values.cat.codes.to_numpy()
+        return float(np.count_nonzero(blank[codes[codes >= 0]]) / len(values))
+    return float(np.fromiter((not str(v).strip() for v in values.to_numpy()), dtype=bool, count=len(values)).mean())
+
+
+def _month_series(month_counts: Counter[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Sorted ("YYYY-MM" keys → datetime64[M], counts) arrays for a per-month line chart."""
+    months = sorted(month_counts)
+    counts = np.fromiter((month_counts[m] for m in months), dtype=np.int64, count=len(months))
+    return np.array(months, dtype="datetime64[M]"), counts
+
+
+def _log_int_bins(max_value: float, num: int) -> np.ndarray:
+    """Integer histogram edges: 0, then `num` geometric steps from 1 to `max_value` (truncation duplicates dropped)."""
+    raw = np.geomspace(1.0, int(max(1, max_value)), num).astype(np.int64)
+    keep = np.empty(raw.size, dtype=bool)
+    keep[0] = True
+    np.not_equal(raw[1:], raw[:-1], out=keep[1:])
+    return np.concatenate(([0], raw[keep]))
+
+
+def _quantile(values: np.ndarray, q: float) -> float:
     """
-    Compute Matplotlib bxp() stats using percentile whiskers.
+    `np.quantile(values, q)` (default "linear" method) from a single-kth `np.partition`: the
+    upper neighbour is the min of the partitioned tail, which for high q is a small slice.
+    """
+    h = (values.size - 1) * q
+    lo = int(h)
+    part = np.partition(values, lo)
+    a = float(part[lo])
+    if lo + 1 >= values.size:
+        return a
+    b = float(part[lo + 1 :].min())
+    t = h - lo
+    return b - (b - a) * (1 - t) if t >= 0.5 else a + (b - a) * t
+
+
+def _box_stats_many(
+    groups: list[np.ndarray],
+    labels: list[str],
+    *,
+    whis_q: tuple[float, float] = (0.05, 0.95),
+) -> list[dict[str, Any]]:
+    """
+    Compute Matplotlib bxp() stats (percentile whiskers) for several non-negative integer groups.
     This avoids materializing a huge long-form DataFrame for seaborn boxplots.
+
+    All groups are packed into one buffer (each shifted past the previous group's max) so a single
+    np.partition yields every order statistic; values match np.quantile's default "linear" method.
+    Empty groups get all-zero stats.
     """
-    if data.size == 0:
-        return {"label": label, "med": 0.0, "q1": 0.0, "q3": 0.0, "whislo": 0.0, "whishi": 0.0, "fliers": []}
-    qs = np.quantile(data, [whis_q[0], 0.25, 0.5, 0.75, whis_q[1]])
-    return {
-        "label": label,
-        "whislo": float(qs[0]),
-        "q1": float(qs[1]),
-        "med": float(qs[2]),
-        "q3": float(qs[3]),
-        "whishi": float(qs[4]),
-        "fliers": [],
-    }
+    qs = np.array([whis_q[0], 0.25, 0.5, 0.75, whis_q[1]])
+    sizes = np.array([g.size for g in groups], dtype=np.int64)
+    out = np.zeros((len(groups), qs.size))
+    nonempty = np.flatnonzero(sizes)
+    if nonempty.size:
+        span = max(int(groups[i].max()) for i in nonempty) + 1
+        packed = np.concatenate([groups[i].astype(np.int64) + k * span for k, i in enumerate(nonempty)])
+        n = sizes[nonempty][:, None]
+        starts = np.cumsum(n, axis=0) - n
+        h = (n - 1) * qs
+        lo = np.floor(h).astype(np.int64)
+        hi = np.minimum(lo + 1, n - 1)
+        part = np.partition(packed, np.unique(np.concatenate([(starts + lo).ravel(), (starts + hi).ravel()])))
+        shift = np.arange(nonempty.size)[:, None] * span
+        a = part[starts + lo] - shift
+        b = part[starts + hi] - shift
+        t = h - lo
+        out[nonempty] = np.where(t >= 0.5, b - (b - a) * (1 - t), a + (b - a) * t)
+    return [
+        {
+            "label": label,
+            "whislo": float(row[0]),
+            "q1": float(row[1]),
+            "med": float(row[2]),
+            "q3": float(row[3]),
+            "whishi": float(row[4]),
+            "fliers": [],
+        }
+        for label, row in zip(labels, out)
+    ]
 
 
-def _np_view(arr: array, dtype: np.dtype) -> np.ndarray:
+def _top_k_desc(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the `k` largest values, largest first with ties in index order — the same as
+    `np.argsort(-values, kind="stable")[:k]`, but only the candidates found by one
+    `np.partition` get sorted.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= values.size:
+        return np.argsort(-values, kind="stable")
+    kth = np.partition(values, values.size - k)[values.size - k]
+    candidates = np.flatnonzero(values >= kth)
+    return candidates[np.argsort(-values[candidates], kind="stable")[:k]]
+
+
+def _np_view(arr: array | np.ndarray, dtype: np.dtype) -> np.ndarray:
     """Return a NumPy view of a Python array when possible; otherwise, a safe copy."""
+    if isinstance(arr, np.ndarray):
+        # Already-NumPy columns (stars, lat/long) pass through without a copy when the dtype matches.
+        return arr.astype(dtype, copy=False)
     if len(arr) == 0:
         return np.array([], dtype=dtype)
     view = np.frombuffer(arr, dtype=dtype)
@@ -398,23 +1105,53 @@ def main() -> int:
     parser.add_argument("--max-users", type=int, default=-1, help="Max users to process (0 = skip, -1 = all).")
     parser.add_argument("--max-tips", type=int, default=-1, help="Max tips to process (0 = skip, -1 = all).")
     parser.add_argument("--max-photos", type=int, default=0, help="Max photo rows to process (0 = skip).")
+    parser.add_argument(
+        "--distributions",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Business distribution charts (01–05, 11–16) and table. --no-distributions keeps only the ranking charts (06–10) and skips building the business DataFrame.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Worker processes for the check-in/review/user/tip files. Uncapped files are split into byte-range shards across them.",
+    )
+    parser.add_argument("--backend", choices=("python", "polars"), default="python", help="Business/review-file parser (polars = multi-threaded; requires the polars package).")
 
     args = parser.parse_args()
+    if args.backend == "polars" and pl is None:
+        parser.error("--backend polars requires the `polars` package (pip install polars).")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
     _apply_theme()
 
-    states = {s.strip().upper() for s in args.state if s.strip()}
-    cities = {c.strip().lower() for c in args.city if c.strip()}
+    states = frozenset(s.strip().upper() for s in args.state if s.strip())
+    cities = frozenset(c.strip().lower() for c in args.city if c.strip())
     category_substrings = [c.strip().lower() for c in args.category if c.strip()]
 
     if not args.zip.exists():
         raise FileNotFoundError(f"Missing zip file: {args.zip}")
 
     # ---- Accumulators (business) ----
-    business_rows: list[dict] = []
-    category_counts: Counter[str] = Counter()
-    category_star_sum: defaultdict[str, float] = defaultdict(float)
-    category_review_sum: defaultdict[str, float] = defaultdict(float)
-    category_business_ct: Counter[str] = Counter()
+    # One typed buffer per column (struct-of-arrays) instead of a dict per business.
+    b_id: list[str] = []
+    b_city: list[str] = []
+    b_state: list[str] = []
+    b_review_count: array = array("I")
+    b_is_open: array = array("B")
+    b_n_cat: array = array("H")
+    b_days_open: array = array("B")
+    b_price: array = array("b")  # -1 = missing
+    # stars (float32) and latitude/longitude (float64) become NumPy arrays once parsing finishes.
+    b_stars: np.ndarray
+    b_lat: np.ndarray
+    b_lon: np.ndarray
+
+    # Categories are interned to ids once; every (business, category) pair is recorded as an id
+    # (in business order, `b_n_cat` per business) and summed with NumPy after parsing.
+    cat_id: dict[str, int] = {}
+    b_cat_ids: array = array("I")
 
     city_state_counts: Counter[tuple[str, str]] = Counter()
     city_counts: Counter[str] = Counter()
@@ -423,36 +1160,11 @@ def main() -> int:
     # `hours` coverage (0–7 days)
     days_open_counts: Counter[int] = Counter()
 
-    # ---- Accumulators (checkins) ----
-    checkin_matrix: np.ndarray | None = None
-    checkin_day_counts: np.ndarray | None = None
-    checkin_hour_counts: np.ndarray | None = None
+    # ---- Per-file counts (filled from worker results) ----
     checkins_total = 0
-
-    # ---- Accumulators (reviews) ----
-    review_month_counts: Counter[str] = Counter()
-    review_star_counts: Counter[int] = Counter()
-    review_lengths: array = array("I")
-    review_lengths_by_star: dict[int, array] = {s: array("I") for s in range(1, 6)}
-    vote_useful: array = array("I")
-    vote_funny: array = array("I")
-    vote_cool: array = array("I")
     reviews_counted = 0
-
-    # ---- Accumulators (users) ----
-    user_join_year_counts: Counter[int] = Counter()
-    user_review_counts: array = array("I")
-    user_fans_counts: array = array("I")
-    user_avg_stars: array = array("f")
     users_counted = 0
-
-    # ---- Accumulators (tips) ----
-    tip_month_counts: Counter[str] = Counter()
-    tip_compliments: array = array("I")
     tips_counted = 0
-
-    # ---- Accumulators (photos) ----
-    photo_label_counts: Counter[str] = Counter()
     photos_counted = 0
 
     specs: list[ChartSpec] = []
@@ -460,9 +1172,15 @@ def main() -> int:
     print(f"Reading archive: {args.zip}")
 
     tf = _iter_tar_members_from_zip(args.zip)
+    # Workers parse the spooled files and render charts. They are spawned rather than forked:
+    # forked workers occasionally laid out their first chart differently from a clean process.
+    pool = multiprocessing.get_context("spawn").Pool(processes=args.jobs, initializer=_apply_theme)
+    _RENDER["pool"] = pool
+    spool_dir = tempfile.TemporaryDirectory(prefix="yelp_spool_")
     try:
-        business_id_set: set[str] | None = None
+        business_id_set: frozenset[str] | None = None
         df_business: pd.DataFrame | None = None
+        pending: list[tuple[str, Any]] = []
 
         for member in tf:
             if not member.isfile():
@@ -476,146 +1194,208 @@ def main() -> int:
                 if fileobj is None:
                     raise RuntimeError("Failed to read business file from archive.")
 
-                for b in _iter_jsonl_dicts(fileobj):
-                    if not _business_passes_filters(
-                        b,
+                if args.backend == "polars":
+                    df_pl = _scan_businesses_polars(
+                        fileobj,
                         states=states,
                         cities=cities,
                         category_substrings=category_substrings,
-                    ):
-                        continue
-
-                    business_id = _normalize_str(b.get("business_id"))
-                    stars = _safe_float(b.get("stars"))
-                    review_count = int(b.get("review_count", 0) or 0)
-
-                    categories_list = _split_categories(b.get("categories"))
-                    for cat in categories_list:
-                        category_counts[cat] += 1
-                        if not math.isnan(stars):
-                            category_star_sum[cat] += stars
-                        category_review_sum[cat] += float(review_count)
-                        category_business_ct[cat] += 1
-
-                    state_code = _normalize_str(b.get("state")).upper()
-                    city = _normalize_str(b.get("city"))
-                    if state_code:
-                        state_counts[state_code] += 1
-                    if city:
-                        city_counts[city] += 1
-                        city_state_counts[(city, state_code)] += 1
-
-                    hours = b.get("hours")
-                    if isinstance(hours, dict):
-                        days_open_counts[len(hours)] += 1
-                        days_open = len(hours)
-                    else:
-                        days_open_counts[0] += 1
-                        days_open = 0
-
-                    attrs = b.get("attributes") or {}
-                    if not isinstance(attrs, dict):
-                        attrs = {}
-
-                    price_range = _parse_int(attrs.get("RestaurantsPriceRange2"))
-
-                    business_rows.append(
-                        {
-                            "business_id": business_id,
-                            "stars": stars,
-                            "review_count": review_count,
-                            "city": city,
-                            "state": state_code,
-                            "latitude": _safe_float(b.get("latitude")),
-                            "longitude": _safe_float(b.get("longitude")),
-                            "is_open": int(b.get("is_open", 0) or 0),
-                            "n_categories": len(categories_list),
-                            "days_open": days_open,
-                            "price_range": price_range,
-                        }
                     )
+                    b_id = df_pl["business_id"].to_list()
+                    b_city = list(map(sys.intern, df_pl["city"].to_list()))
+                    b_state = list(map(sys.intern, df_pl["state"].to_list()))
+                    b_stars = df_pl["stars"].to_numpy()
+                    b_review_count = df_pl["review_count"].to_numpy()
+                    b_lat = df_pl["latitude"].to_numpy()
+                    b_lon = df_pl["longitude"].to_numpy()
+                    b_is_open = df_pl["is_open"].to_numpy()
+                    b_n_cat = df_pl["categories"].list.len().cast(pl.UInt16).to_numpy()
+                    b_days_open = df_pl["days_open"].to_numpy()
+                    b_price = df_pl["price_range"].to_numpy()
+                    pairs = df_pl["categories"].explode().drop_nulls()
+                    cat_id = {cat: i for i, cat in enumerate(pairs.unique(maintain_order=True).to_list())}
+                    b_cat_ids = pairs.replace_strict(cat_id, return_dtype=pl.UInt32).to_numpy()
+                    del df_pl, pairs
+                else:
+                    # Float fields are collected raw and coerced in bulk after the loop.
+                    raw_stars: list[Any] = []
+                    raw_lat: list[Any] = []
+                    raw_lon: list[Any] = []
+                    for b in _iter_jsonl_dicts(fileobj):
+                        # Filters are checked inline (cheapest first); state/city are normalized
+                        # once here and reused for the tallies below.
+                        state_code = b.get("state")
+                        state_code = state_code.strip().upper() if isinstance(state_code, str) else ""
+                        if states and state_code not in states:
+                            continue
+                        city = b.get("city")
+                        city = city.strip() if isinstance(city, str) else ""
+                        if cities and city.lower() not in cities:
+                            continue
+                        categories_field = b.get("categories")
+                        if category_substrings:
+                            categories_lower = categories_field.lower() if isinstance(categories_field, str) else ""
+                            if not any(sub in categories_lower for sub in category_substrings):
+                                continue
+
+                        business_id = _normalize_str(b.get("business_id"))
+                        review_count = int(b.get("review_count", 0) or 0)
+
+                        categories_list = _split_categories(categories_field)
+                        for cat in categories_list:
+                            idx = cat_id.get(cat)
+                            if idx is None:
+                                idx = cat_id[cat] = len(cat_id)
+                            b_cat_ids.append(idx)
+
+                        hours = b.get("hours")
+                        days_open = len(hours) if isinstance(hours, dict) else 0
+
+                        attrs = b.get("attributes") or {}
+                        if not isinstance(attrs, dict):
+                            attrs = {}
+
+                        price_range = _parse_int(attrs.get("RestaurantsPriceRange2"))
+
+                        b_id.append(business_id)
+                        # Interned: ~1k distinct cities/states shared across every business row,
+                        # with cached hashes for the tallies and categoricals below.
+                        b_city.append(sys.intern(city))
+                        b_state.append(sys.intern(state_code))
+                        raw_stars.append(b.get("stars"))
+                        b_review_count.append(review_count)
+                        raw_lat.append(b.get("latitude"))
+                        raw_lon.append(b.get("longitude"))
+                        b_is_open.append(int(b.get("is_open", 0) or 0))
+                        b_n_cat.append(len(categories_list))
+                        b_days_open.append(days_open)
+                        b_price.append(price_range if price_range is not None and 0 <= price_range <= 127 else -1)
+
+                    b_stars = pd.to_numeric(raw_stars, errors="coerce").astype(np.float32)
+                    b_lat = pd.to_numeric(raw_lat, errors="coerce").astype(np.float64)
+                    b_lon = pd.to_numeric(raw_lon, errors="coerce").astype(np.float64)
+                    del raw_stars, raw_lat, raw_lon
 
                 fileobj.close()
 
-                if not business_rows:
+                if not b_id:
                     raise RuntimeError("No businesses matched your filters; try removing filters.")
 
-                df_business = pd.DataFrame.from_records(business_rows)
-                business_id_set = set(df_business["business_id"].tolist())
-                print(f"Selected businesses: {len(df_business):,}")
+                # Tallies come straight from the columns (same for both backends).
+                state_counts.update(filter(None, b_state))
+                city_counts.update(filter(None, b_city))
+                city_state_counts.update((c, st) for c, st in zip(b_city, b_state) if c)
+                days_open_counts.update(_np_view(b_days_open, np.uint8).tolist())
+
+                if args.distributions:
+                    price_np = _np_view(b_price, np.int8)
+                    df_business = pd.DataFrame(
+                        {
+                            "business_id": b_id,
+                            "stars": _np_view(b_stars, np.float32),
+                            "review_count": _np_view(b_review_count, np.uint32),
+                            # Few distinct values → categoricals count/group on int codes.
+                            "city": pd.Categorical(b_city),
+                            "state": pd.Categorical(b_state),
+                            "latitude": _np_view(b_lat, np.float64),
+                            "longitude": _np_view(b_lon, np.float64),
+                            "is_open": _np_view(b_is_open, np.uint8),
+                            "n_categories": _np_view(b_n_cat, np.uint16),
+                            "days_open": _np_view(b_days_open, np.uint8),
+                            "price_range": pd.arrays.IntegerArray(price_np.astype(np.int8), mask=price_np < 0),
+                        }
+                    )
+                # Built from the id column we already hold (both backends) — no DataFrame→list round trip.
+                business_id_set = frozenset(b_id)
+
+                cat_names = list(cat_id)
+                pair_cat = _np_view(b_cat_ids, np.uint32)
+                pair_row = np.repeat(np.arange(len(b_id)), _np_view(b_n_cat, np.uint16))
+                cat_count = np.bincount(pair_cat, minlength=len(cat_names))
+                pair_stars = _np_view(b_stars, np.float32)[pair_row].astype(np.float64)
+                cat_star_sum = np.bincount(pair_cat, weights=np.nan_to_num(pair_stars), minlength=len(cat_names))
+                print(f"Selected businesses: {len(b_id):,}")
 
                 # -------------------- FIGURES (BUSINESS) --------------------
 
-                # 01 Stars distribution
-                fig, ax = plt.subplots(figsize=(8, 4.5))
-                sns.histplot(df_business["stars"].dropna(), bins=np.arange(0.75, 5.26, 0.25), ax=ax, edgecolor="white", linewidth=0.25)
-                mean_val = df_business["stars"].mean()
-                med_val = df_business["stars"].median()
-                ax.axvline(mean_val, linestyle="--", linewidth=2, label=f"Mean {mean_val:.2f}")
-                ax.axvline(med_val, linestyle=":", linewidth=2, label=f"Median {med_val:.2f}")
-                ax.set_title("What is the distribution of business star ratings?")
-                ax.set_xlabel("Stars")
-                ax.set_ylabel("Number of businesses")
-                _format_large_number_axis(ax, "y")
-                ax.legend(loc="upper left")
-                specs.append(_plot_and_save(fig, args.out, ChartSpec("01_business_star_distribution.png", ax.get_title())))
-
-                # 02 Review count distribution (log x)
-                fig, ax = plt.subplots(figsize=(8, 4.5))
-                rc = df_business["review_count"].clip(lower=0)
-                # Use log-spaced bins for a nicer shape
-                bins = np.unique(np.logspace(0, math.log10(max(1, rc.max())), 40).astype(int))
-                bins = np.r_[0, bins]  # include 0
-                ax.hist(rc, bins=bins)
-                ax.set_xscale("symlog", linthresh=10)
-                ax.set_title("What is the distribution of business review counts? (symlog scale)")
-                ax.set_xlabel("Review count (symlog scale)")
-                ax.set_ylabel("Number of businesses")
-                _format_large_number_axis(ax, "y")
-                specs.append(_plot_and_save(fig, args.out, ChartSpec("02_business_reviewcount_distribution.png", ax.get_title())))
-
-                # 03 Open vs closed
-                fig, ax = plt.subplots(figsize=(7, 4.5))
-                open_counts = df_business["is_open"].value_counts().sort_index()
-                labels = ["Closed (0)", "Open (1)"]
-                values = [int(open_counts.get(0, 0)), int(open_counts.get(1, 0))]
-                bars = ax.bar(labels, values, color=["#EF4444", "#22C55E"])
-                total = sum(values) or 1
-                for bar, val in zip(bars, values):
-                    ax.text(bar.get_x() + bar.get_width() / 2, val, f"{val:,.0f}\n({val/total:.1%})", ha="center", va="bottom", fontsize=10)
-                ax.set_title("What share of businesses are marked open vs closed?")
-                ax.set_xlabel("")
-                ax.set_ylabel("Number of businesses")
-                _format_large_number_axis(ax, "y")
-                specs.append(_plot_and_save(fig, args.out, ChartSpec("03_open_vs_closed.png", ax.get_title())))
-
-                # 04 Review count vs stars (hexbin, log x)
-                fig, ax = plt.subplots(figsize=(8, 4.8))
-                x = df_business["review_count"].clip(lower=1)
-                y = df_business["stars"]
-                hb = ax.hexbin(x, y, gridsize=45, xscale="log", mincnt=1, bins="log", cmap="mako")
-                fig.colorbar(hb, ax=ax, label="Businesses (log scale)")
-                ax.set_title("How do star ratings vary with review count? (hexbin; log x)")
-                ax.set_xlabel("Review count (log scale)")
-                ax.set_ylabel("Stars")
-                specs.append(_plot_and_save(fig, args.out, ChartSpec("04_reviewcount_vs_stars_hexbin.png", ax.get_title())))
-
-                # 05 Categories per business distribution
-                fig, ax = plt.subplots(figsize=(8, 4.5))
-                sns.histplot(df_business["n_categories"], bins=range(0, int(df_business["n_categories"].max()) + 2), ax=ax, edgecolor="white", linewidth=0.25)
-                ax.set_title("How many categories are listed per business?")
-                ax.set_xlabel("Number of categories listed")
-                ax.set_ylabel("Number of businesses")
-                _format_large_number_axis(ax, "y")
-                specs.append(_plot_and_save(fig, args.out, ChartSpec("05_categories_per_business.png", ax.get_title())))
+                if args.distributions:
+                    # Simple reductions run on the column arrays directly (no Series round trips).
+                    stars_np = _np_view(b_stars, np.float32)
+                    review_count_np = _np_view(b_review_count, np.uint32)
+                    is_open_np = _np_view(b_is_open, np.uint8)
+
+                    # 01 Stars distribution
+                    fig, ax = _get_fig((8, 4.5))
+                    stars_valid = stars_np[~np.isnan(stars_np)]
+                    counts, edges = np.histogram(stars_valid, bins=np.arange(0.75, 5.26, 0.25))
+                    _hist_bars(ax, counts, edges, alpha=0.75, edgecolor="white", linewidth=0.25)
+                    mean_val = stars_valid.mean(dtype=np.float64)
+                    med_val = np.median(stars_valid)
+                    ax.axvline(mean_val, linestyle="--", linewidth=2, label=f"Mean {mean_val:.2f}")
+                    ax.axvline(med_val, linestyle=":", linewidth=2, label=f"Median {med_val:.2f}")
+                    ax.set_title("What is the distribution of business star ratings?")
+                    ax.set_xlabel("Stars")
+                    ax.set_ylabel("Number of businesses")
+                    _format_large_number_axis(ax, "y")
+                    ax.legend(loc="upper left")
+                    specs.append(_plot_and_save(fig, args.out, ChartSpec("01_business_star_distribution.png", ax.get_title())))
+
+                    # 02 Review count distribution (log x)
+                    fig, ax = _get_fig((8, 4.5))
+                    # Use log-spaced bins for a nicer shape
+                    bins = _log_int_bins(review_count_np.max(), 40)
+                    counts, edges = np.histogram(review_count_np, bins=bins)
+                    _hist_bars(ax, counts, edges)
+                    ax.set_xscale("symlog", linthresh=10)
+                    ax.set_title("What is the distribution of business review counts? (symlog scale)")
+                    ax.set_xlabel("Review count (symlog scale)")
+                    ax.set_ylabel("Number of businesses")
+                    _format_large_number_axis(ax, "y")
+                    specs.append(_plot_and_save(fig, args.out, ChartSpec("02_business_reviewcount_distribution.png", ax.get_title())))
+
+                    # 03 Open vs closed
+                    fig, ax = _get_fig((7, 4.5))
+                    open_counts = np.bincount(is_open_np, minlength=2)
+                    labels = ["Closed (0)", "Open (1)"]
+                    values = [int(open_counts[0]), int(open_counts[1])]
+                    bars = ax.bar(labels, values, color=["#EF4444", "#22C55E"])
+                    total = sum(values) or 1
+                    for bar, val in zip(bars, values):
+                        ax.text(bar.get_x() + bar.get_width() / 2, val, f"{val:,.0f}\n({val/total:.1%})", ha="center", va="bottom", fontsize=10)
+                    ax.set_title("What share of businesses are marked open vs closed?")
+                    ax.set_xlabel("")
+                    ax.set_ylabel("Number of businesses")
+                    _format_large_number_axis(ax, "y")
+                    specs.append(_plot_and_save(fig, args.out, ChartSpec("03_open_vs_closed.png", ax.get_title())))
+
+                    # 04 Review count vs stars (hexbin, log x)
+                    fig, ax = _get_fig((8, 4.8))
+                    x = np.maximum(review_count_np, 1).astype(np.float32)
+                    hb = ax.hexbin(x, stars_np, gridsize=45, xscale="log", mincnt=1, bins="log", cmap="mako")
+                    fig.colorbar(hb, ax=ax, label="Businesses (log scale)")
+                    ax.set_title("How do star ratings vary with review count? (hexbin; log x)")
+                    ax.set_xlabel("Review count (log scale)")
+                    ax.set_ylabel("Stars")
+                    specs.append(_plot_and_save(fig, args.out, ChartSpec("04_reviewcount_vs_stars_hexbin.png", ax.get_title())))
+
+                    # 05 Categories per business distribution
+                    fig, ax = _get_fig((8, 4.5))
+                    counts = np.bincount(_np_view(b_n_cat, np.uint16))
+                    _hist_bars(ax, counts, np.arange(counts.size + 1), alpha=0.75, edgecolor="white", linewidth=0.25)
+                    ax.set_title("How many categories are listed per business?")
+                    ax.set_xlabel("Number of categories listed")
+                    ax.set_ylabel("Number of businesses")
+                    _format_large_number_axis(ax, "y")
+                    specs.append(_plot_and_save(fig, args.out, ChartSpec("05_categories_per_business.png", ax.get_title())))
 
                 # 06 Top categories by business count
-                top_categories = category_counts.most_common(args.top_n)
+                top_idx = _top_k_desc(cat_count, args.top_n)
+                top_categories = [(cat_names[i], int(cat_count[i])) for i in top_idx]
                 if top_categories:
                     cats, counts = zip(*top_categories)
                     fig_height = max(6.0, 0.35 * len(cats) + 1.6)
-                    fig, ax = plt.subplots(figsize=(10, fig_height))
-                    colors = sns.color_palette("mako", n_colors=len(cats))
+                    fig, ax = _get_fig((10, fig_height))
+                    colors = _palette("mako", len(cats))
                     _barh_with_value_labels(ax, list(cats), list(counts), colors=colors)
                     ax.set_title(f"Which categories appear most often? (Top {len(cats)} by business count)")
                     ax.set_xlabel("Number of businesses")
@@ -623,20 +1403,16 @@ def main() -> int:
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("06_top_categories_by_count.png", ax.get_title())))
 
                 # 07 Top categories by average stars
-                if category_business_ct:
-                    rows = []
-                    for cat, ct in category_business_ct.items():
-                        if ct < 50:  # helps reduce noise; tweak if you filter to small subsets
-                            continue
-                        avg = category_star_sum[cat] / ct if ct else float("nan")
-                        rows.append((cat, ct, avg))
-                    rows.sort(key=lambda t: t[2], reverse=True)
-                    top = rows[: args.top_n]
+                if cat_names:
+                    keep = np.flatnonzero(cat_count >= 50)  # helps reduce noise; tweak if you filter to small subsets
+                    avgs = cat_star_sum[keep] / cat_count[keep]
+                    order = _top_k_desc(avgs, args.top_n)
+                    top = [(cat_names[keep[i]], int(cat_count[keep[i]]), float(avgs[i])) for i in order]
                     if top:
                         labels = [t[0] for t in top]
                         avgs = [t[2] for t in top]
                         fig_height = max(6.0, 0.35 * len(labels) + 1.6)
-                        fig, ax = plt.subplots(figsize=(10, fig_height))
+                        fig, ax = _get_fig((10, fig_height))
                         y = np.arange(len(labels))
                         bars = ax.barh(y, avgs)
                         ax.set_yticks(y, labels=labels)
@@ -659,8 +1435,8 @@ def main() -> int:
                     city_labels = [f"{city}, {state}" if state else city for (city, state), _ in top_cities]
                     counts = [count for _, count in top_cities]
                     fig_height = max(6.0, 0.35 * len(city_labels) + 1.6)
-                    fig, ax = plt.subplots(figsize=(10, fig_height))
-                    colors = sns.color_palette("viridis", n_colors=len(city_labels))
+                    fig, ax = _get_fig((10, fig_height))
+                    colors = _palette("viridis", len(city_labels))
                     _barh_with_value_labels(ax, city_labels, counts, colors=colors)
                     ax.set_title(f"Which cities have the most businesses? (Top {len(city_labels)} city+state pairs)")
                     ax.set_xlabel("Number of businesses")
@@ -673,8 +1449,8 @@ def main() -> int:
                     labels = [s for s, _ in top_states]
                     counts = [c for _, c in top_states]
                     fig_height = max(6.0, 0.35 * len(labels) + 1.6)
-                    fig, ax = plt.subplots(figsize=(9, fig_height))
-                    colors = sns.color_palette("crest", n_colors=len(labels))
+                    fig, ax = _get_fig((9, fig_height))
+                    colors = _palette("crest", len(labels))
                     _barh_with_value_labels(ax, labels, counts, colors=colors)
                     ax.set_title(f"Which states/provinces have the most businesses? (Top {len(labels)} by business count)")
                     ax.set_xlabel("Number of businesses")
@@ -687,7 +1463,7 @@ def main() -> int:
                     for st, ct in state_counts.items():
                         country_counts[_country_for_state_code(st)] += ct
                     df_countries = pd.DataFrame(country_counts.most_common(), columns=["country", "businesses"])
-                    fig, ax = plt.subplots(figsize=(7, 4.5))
+                    fig, ax = _get_fig((7, 4.5))
                     ax.bar(df_countries["country"], df_countries["businesses"])
                     ax.set_title("How are businesses split across Canada, the U.S., and other? (from state code)")
                     ax.set_xlabel("Country")
@@ -695,129 +1471,169 @@ def main() -> int:
                     _format_large_number_axis(ax, "y")
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("10_country_distribution.png", ax.get_title())))
 
-                # 11 Location density (hexbin lat/long)
-                df_geo = df_business.dropna(subset=["latitude", "longitude"])
-                if len(df_geo) > 0:
-                    fig, ax = plt.subplots(figsize=(8, 6))
-                    hb = ax.hexbin(
-                        df_geo["longitude"],
-                        df_geo["latitude"],
-                        gridsize=70,
-                        bins="log",
-                        mincnt=1,
-                        cmap="mako",
-                    )
-                    fig.colorbar(hb, ax=ax, label="Businesses (log scale)")
-                    ax.set_title("Where are businesses located geographically? (latitude/longitude density)")
-                    ax.set_xlabel("Longitude")
-                    ax.set_ylabel("Latitude")
-                    specs.append(_plot_and_save(fig, args.out, ChartSpec("11_location_density_hexbin.png", ax.get_title(), notes="hexbin over lat/long")))
-
-                # 12 Missingness (selected business fields)
-                fig, ax = plt.subplots(figsize=(8, 4.8))
-                key_fields = ["stars", "review_count", "city", "state", "latitude", "longitude", "n_categories"]
-                missing_rates = {}
-                for col in key_fields:
-                    if col not in df_business.columns:
-                        continue
-                    if df_business[col].dtype == object:
-                        missing = df_business[col].astype(str).str.strip().eq("").mean()
-                    else:
-                        missing = df_business[col].isna().mean()
-                    missing_rates[col] = missing
-                df_miss = pd.DataFrame({"field": list(missing_rates.keys()), "missing_rate": list(missing_rates.values())})
-                df_miss = df_miss.sort_values("missing_rate", ascending=False)
-                ax.bar(df_miss["field"], df_miss["missing_rate"])
-                ax.set_title("Which key business fields are most often missing?")
-                ax.set_xlabel("")
-                ax.set_ylabel("Missing rate")
-                ax.yaxis.set_major_formatter(mticker.PercentFormatter(1.0))
-                ax.tick_params(axis="x", rotation=30)
-                plt.setp(ax.get_xticklabels(), ha="right")
-                specs.append(_plot_and_save(fig, args.out, ChartSpec("12_business_missingness.png", ax.get_title())))
-
-                # 13 Days open per week (from `hours`)
-                if df_business["days_open"].notna().any():
-                    fig, ax = plt.subplots(figsize=(8, 4.5))
-                    order = list(range(0, 8))
-                    counts = [int(days_open_counts.get(i, 0)) for i in order]
-                    bars = ax.bar([str(i) for i in order], counts)
-                    total = sum(counts) or 1
-                    for bar, val in zip(bars, counts):
-                        if val == 0:
-                            continue
-                        ax.text(bar.get_x() + bar.get_width()/2, val, f"{val/total:.1%}", ha="center", va="bottom", fontsize=10)
-                    ax.set_title("How many days per week do businesses report hours? (0–7 days listed)")
-                    ax.set_xlabel("Days with hours listed (0–7)")
-                    ax.set_ylabel("Number of businesses")
-                    _format_large_number_axis(ax, "y")
-                    specs.append(_plot_and_save(fig, args.out, ChartSpec("13_days_open_per_week.png", ax.get_title(), notes="0 = missing `hours`")))
-
-                # 14 Price range availability + distribution
-                df_price = df_business.dropna(subset=["price_range"]).copy()
-                df_price = df_price[df_price["price_range"].between(1, 4)]
-                if not df_price.empty:
-                    fig, ax = plt.subplots(figsize=(7, 4.5))
-                    pr_counts = df_price["price_range"].value_counts().sort_index()
-                    bars = ax.bar([str(i) for i in pr_counts.index], pr_counts.values)
-                    total = pr_counts.sum() or 1
-                    for bar, val in zip(bars, pr_counts.values):
-                        ax.text(bar.get_x() + bar.get_width()/2, val, f"{val/total:.1%}", ha="center", va="bottom", fontsize=10)
-                    ax.set_title("What price ranges do restaurants report? (RestaurantsPriceRange2, 1–4)")
-                    ax.set_xlabel("Price range (1=cheap, 4=expensive)")
-                    ax.set_ylabel("Number of businesses")
-                    _format_large_number_axis(ax, "y")
-                    specs.append(_plot_and_save(fig, args.out, ChartSpec("14_price_range_distribution.png", ax.get_title(), notes=f"{len(df_price):,} businesses with price range")))
-
-                    # 15 Stars by price range (violin)
-                    fig, ax = plt.subplots(figsize=(7.5, 4.8))
-                    sns.violinplot(data=df_price, x="price_range", y="stars", ax=ax, inner="quartile", cut=0)
-                    ax.set_title("How do star ratings vary by restaurant price range?")
-                    ax.set_xlabel("Price range (1=cheap, 4=expensive)")
+                if args.distributions:
+                    # 11 Location density (hexbin lat/long)
+                    df_geo = df_business.dropna(subset=["latitude", "longitude"])
+                    if len(df_geo) > 0:
+                        fig, ax = _get_fig((8, 6))
+                        # Pre-binned 2D histogram (~hexbin gridsize=70 cell shape) drawn as one mesh;
+                        # empty cells are masked like hexbin's mincnt=1.
+                        counts, xedges, yedges = np.histogram2d(
+                            df_geo["longitude"].to_numpy(np.float32),
+                            df_geo["latitude"].to_numpy(np.float32),
+                            bins=(70, 40),
+                        )
+                        mesh = ax.pcolormesh(
+                            xedges,
+                            yedges,
+                            np.ma.masked_less(counts.T, 1),
+                            norm=mcolors.LogNorm(),
+                            cmap="mako",
+                            shading="flat",
+                        )
+                        fig.colorbar(mesh, ax=ax, label="Businesses (log scale)")
+                        ax.set_title("Where are businesses located geographically? (latitude/longitude density)")
+                        ax.set_xlabel("Longitude")
+                        ax.set_ylabel("Latitude")
+                        specs.append(_plot_and_save(fig, args.out, ChartSpec("11_location_density_hexbin.png", ax.get_title(), notes="2D histogram over lat/long")))
+
+                    # 12 Missingness (selected business fields)
+                    fig, ax = _get_fig((8, 4.8))
+                    key_fields = ["stars", "review_count", "city", "state", "latitude", "longitude", "n_categories"]
+                    key_fields = [col for col in key_fields if col in df_business.columns]
+                    text_fields = [col for col in key_fields if df_business[col].dtype == object or isinstance(df_business[col].dtype, pd.CategoricalDtype)]
+                    # Text columns count blank strings as missing; numeric columns count NaN (one isna pass).
+                    missing_rates = df_business[[col for col in key_fields if col not in text_fields]].isna().mean().to_dict()
+                    missing_rates.update({col: _blank_rate(df_business[col]) for col in text_fields})
+                    missing_rates = {col: missing_rates[col] for col in key_fields}
+                    df_miss = pd.DataFrame({"field": list(missing_rates.keys()), "missing_rate": list(missing_rates.values())})
+                    df_miss = df_miss.sort_values("missing_rate", ascending=False)
+                    ax.bar(df_miss["field"], df_miss["missing_rate"])
+                    ax.set_title("Which key business fields are most often missing?")
+                    ax.set_xlabel("")
+                    ax.set_ylabel("Missing rate")
+                    ax.yaxis.set_major_formatter(mticker.PercentFormatter(1.0))
+                    ax.tick_params(axis="x", rotation=30)
+                    plt.setp(ax.get_xticklabels(), ha="right")
+                    specs.append(_plot_and_save(fig, args.out, ChartSpec("12_business_missingness.png", ax.get_title())))
+
+                    # 13 Days open per week (from `hours`)
+                    if days_open_counts:
+                        fig, ax = _get_fig((8, 4.5))
+                        order = list(range(0, 8))
+                        counts = [int(days_open_counts.get(i, 0)) for i in order]
+                        bars = ax.bar([str(i) for i in order], counts)
+                        total = sum(counts) or 1
+                        for bar, val in zip(bars, counts):
+                            if val == 0:
+                                continue
+                            ax.text(bar.get_x() + bar.get_width()/2, val, f"{val/total:.1%}", ha="center", va="bottom", fontsize=10)
+                        ax.set_title("How many days per week do businesses report hours? (0–7 days listed)")
+                        ax.set_xlabel("Days with hours listed (0–7)")
+                        ax.set_ylabel("Number of businesses")
+                        _format_large_number_axis(ax, "y")
+                        specs.append(_plot_and_save(fig, args.out, ChartSpec("13_days_open_per_week.png", ax.get_title(), notes="0 = missing `hours`")))
+
+                    # 14 Price range availability + distribution
+                    has_price = (price_np >= 1) & (price_np <= 4)
+                    n_priced = int(has_price.sum())
+                    if n_priced:
+                        fig, ax = _get_fig((7, 4.5))
+                        pr_counts = np.bincount(price_np[has_price], minlength=5)
+                        pr_levels = np.flatnonzero(pr_counts)
+                        bars = ax.bar([str(i) for i in pr_levels], pr_counts[pr_levels])
+                        total = n_priced
+                        for bar, val in zip(bars, pr_counts[pr_levels]):
+                            ax.text(bar.get_x() + bar.get_width()/2, val, f"{val/total:.1%}", ha="center", va="bottom", fontsize=10)
+                        ax.set_title("What price ranges do restaurants report? (RestaurantsPriceRange2, 1–4)")
+                        ax.set_xlabel("Price range (1=cheap, 4=expensive)")
+                        ax.set_ylabel("Number of businesses")
+                        _format_large_number_axis(ax, "y")
+                        specs.append(_plot_and_save(fig, args.out, ChartSpec("14_price_range_distribution.png", ax.get_title(), notes=f"{n_priced:,} businesses with price range")))
+
+                        # 15 Stars by price range (violin)
+                        fig, ax = _get_fig((7.5, 4.8))
+                        sns.violinplot(x=price_np[has_price], y=stars_np[has_price], ax=ax, inner="quartile", cut=0)
+                        ax.set_title("How do star ratings vary by restaurant price range?")
+                        ax.set_xlabel("Price range (1=cheap, 4=expensive)")
+                        ax.set_ylabel("Stars")
+                        specs.append(_plot_and_save(fig, args.out, ChartSpec("15_stars_by_price_range_violin.png", ax.get_title())))
+
+                    # 16 Stars by open/closed (box)
+                    fig, ax = _get_fig((7.5, 4.8))
+                    known_status = is_open_np <= 1
+                    open_status = np.array(["Closed", "Open"])[is_open_np[known_status]]
+                    sns.boxplot(x=open_status, y=stars_np[known_status], ax=ax)
+                    ax.set_title("Do open vs closed businesses differ in star ratings?")
+                    ax.set_xlabel("")
                     ax.set_ylabel("Stars")
-                    specs.append(_plot_and_save(fig, args.out, ChartSpec("15_stars_by_price_range_violin.png", ax.get_title())))
-
-                # 16 Stars by open/closed (box)
-                fig, ax = plt.subplots(figsize=(7.5, 4.8))
-                df_tmp = df_business.copy()
-                df_tmp["open_status"] = df_tmp["is_open"].map({0: "Closed", 1: "Open"})
-                sns.boxplot(data=df_tmp, x="open_status", y="stars", ax=ax)
-                ax.set_title("Do open vs closed businesses differ in star ratings?")
-                ax.set_xlabel("")
-                ax.set_ylabel("Stars")
-                specs.append(_plot_and_save(fig, args.out, ChartSpec("16_stars_by_open_status.png", ax.get_title())))
-
-                # Save a couple of handy tables for non-Python tools
-                df_business[["business_id","stars","review_count","city","state","latitude","longitude","is_open","n_categories","days_open","price_range"]].to_csv(
-                    args.out / "table_business_sample_fields.csv", index=False
-                )
+                    specs.append(_plot_and_save(fig, args.out, ChartSpec("16_stars_by_open_status.png", ax.get_title())))
 
-            # ------------- CHECKINS -------------
+                    # Save a couple of handy tables for non-Python tools
+                    _write_csv(
+                        df_business[["business_id","stars","review_count","city","state","latitude","longitude","is_open","n_categories","days_open","price_range"]],
+                        args.out / "table_business_sample_fields.csv",
+                    )
+
+            # ------------- CHECKINS / REVIEWS / USERS / TIPS / PHOTOS -------------
+            # Each remaining member is spooled to disk and parsed by a worker process while
+            # this process keeps inflating the tar; charts are drawn after the loop.
             elif name == "yelp_academic_dataset_checkin.json" and not args.no_checkins:
                 if business_id_set is None:
                     raise RuntimeError("Expected to parse business file before checkins (needed for filtering).")
-
                 print("Parsing check-ins…", flush=True)
-                checkin_matrix = np.zeros((7, 24), dtype=np.int64)
-                fileobj = tf.extractfile(member)
-                if fileobj is None:
-                    raise RuntimeError("Failed to read checkin file from archive.")
-                for c in _iter_jsonl_dicts(fileobj):
-                    business_id = _normalize_str(c.get("business_id"))
-                    if business_id not in business_id_set:
-                        continue
-                    date_field = _normalize_str(c.get("date"))
-                    if not date_field:
-                        continue
-                    # Each entry is "YYYY-MM-DD HH:MM:SS" separated by comma+space
-                    for ts in date_field.split(", "):
-                        try:
-                            dt = datetime.fromisoformat(ts)
-                        except ValueError:
-                            continue
-                        checkin_matrix[dt.weekday(), dt.hour] += 1
-                        checkins_total += 1
-                fileobj.close()
+                path = _spool_member(tf, member, spool_dir.name)
+                pending.append(("checkin", _submit_spooled(pool, "checkin", path, business_id_set, -1, args.jobs)))
+
+            elif name == "yelp_academic_dataset_review.json" and args.max_reviews != 0:
+                if business_id_set is None:
+                    raise RuntimeError("Expected to parse business file before reviews (needed for filtering).")
+                if args.max_reviews > 0:
+                    print(f"Parsing reviews (up to {args.max_reviews:,})…", flush=True)
+                else:
+                    print("Parsing reviews (all)…", flush=True)
+                path = _spool_member(tf, member, spool_dir.name)
+                if args.backend == "polars":
+                    job = pool.apply_async(_parse_spooled_polars, ("review", path, business_id_set, args.max_reviews))
+                else:
+                    job = _submit_spooled(pool, "review", path, business_id_set, args.max_reviews, args.jobs)
+                pending.append(("review", job))
+
+            elif name == "yelp_academic_dataset_user.json" and args.max_users != 0:
+                if args.max_users > 0:
+                    print(f"Parsing users (up to {args.max_users:,})…", flush=True)
+                else:
+                    print("Parsing users (all)…", flush=True)
+                path = _spool_member(tf, member, spool_dir.name)
+                pending.append(("user", _submit_spooled(pool, "user", path, frozenset(), args.max_users, args.jobs)))
+
+            elif name == "yelp_academic_dataset_tip.json" and args.max_tips != 0:
+                if business_id_set is None:
+                    raise RuntimeError("Expected to parse business file before tips (needed for filtering).")
+                if args.max_tips > 0:
+                    print(f"Parsing tips (up to {args.max_tips:,})…", flush=True)
+                else:
+                    print("Parsing tips (all)…", flush=True)
+                path = _spool_member(tf, member, spool_dir.name)
+                pending.append(("tip", _submit_spooled(pool, "tip", path, business_id_set, args.max_tips, args.jobs)))
+
+            # Photos are optional; photo.json may not be in Yelp-JSON.tar.
+            elif name == "yelp_academic_dataset_photo.json" and args.max_photos > 0:
+                if business_id_set is None:
+                    raise RuntimeError("Expected to parse business file before photos (needed for filtering).")
+                print(f"Sampling up to {args.max_photos:,} photos…", flush=True)
+                path = _spool_member(tf, member, spool_dir.name)
+                pending.append(("photo", _submit_spooled(pool, "photo", path, business_id_set, args.max_photos, args.jobs)))
+
+        # End loop over tar members
+
+        # Render worker results in archive order so figure numbering matches the tar layout.
+        for kind, job in pending:
+            # ------------- CHECKINS -------------
+            if kind == "checkin":
+                checkin = job.get()
+                checkin_matrix = checkin.matrix
+                checkins_total = checkin.total
 
                 if checkin_matrix.sum() > 0:
                     checkin_day_counts = checkin_matrix.sum(axis=1)
@@ -826,15 +1642,15 @@ def main() -> int:
                     days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
                     # 17 Heatmap
-                    fig, ax = plt.subplots(figsize=(12, 4.5))
-                    sns.heatmap(
-                        checkin_matrix,
-                        ax=ax,
-                        cmap="mako",
-                        cbar_kws={"label": "Check-ins"},
-                        xticklabels=list(range(24)),
-                        yticklabels=days,
-                    )
+                    fig, ax = _get_fig((12, 4.5))
+                    # Plain pcolormesh (what sns.heatmap draws) without seaborn's DataFrame/tick-label plumbing.
+                    sns.despine(ax=ax, left=True, bottom=True)
+                    mesh = ax.pcolormesh(checkin_matrix, cmap="mako")
+                    ax.set(xlim=(0, 24), ylim=(0, 7))
+                    ax.invert_yaxis()
+                    fig.colorbar(mesh, ax=ax, label="Check-ins").outline.set_linewidth(0)
+                    ax.set_xticks(np.arange(24) + 0.5, labels=range(24))
+                    ax.set_yticks(np.arange(7) + 0.5, labels=days, rotation="vertical", va="center")
                     ax.set_title("When do check-ins happen? (day-of-week × hour heatmap)")
                     ax.set_xlabel("Hour of day")
                     ax.set_ylabel("Day of week")
@@ -842,7 +1658,7 @@ def main() -> int:
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("17_checkins_heatmap.png", ax.get_title(), notes=f"{checkins_total:,} check-ins (filtered)")))
 
                     # 18 Check-ins by day of week
-                    fig, ax = plt.subplots(figsize=(8.5, 4.5))
+                    fig, ax = _get_fig((8.5, 4.5))
                     bars = ax.bar(days, checkin_day_counts)
                     total = int(checkin_day_counts.sum()) or 1
                     for bar, val in zip(bars, checkin_day_counts):
@@ -854,7 +1670,7 @@ def main() -> int:
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("18_checkins_by_day.png", ax.get_title())))
 
                     # 19 Check-ins by hour
-                    fig, ax = plt.subplots(figsize=(10, 4.5))
+                    fig, ax = _get_fig((10, 4.5))
                     ax.plot(range(24), checkin_hour_counts, marker="o")
                     ax.set_title("At what hours of the day do check-ins peak?")
                     ax.set_xlabel("Hour of day")
@@ -864,65 +1680,28 @@ def main() -> int:
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("19_checkins_by_hour.png", ax.get_title())))
 
             # ------------- REVIEWS -------------
-            elif name == "yelp_academic_dataset_review.json" and args.max_reviews != 0:
-                if business_id_set is None:
-                    raise RuntimeError("Expected to parse business file before reviews (needed for filtering).")
-
-                if args.max_reviews > 0:
-                    print(f"Parsing reviews (up to {args.max_reviews:,})…", flush=True)
-                else:
-                    print("Parsing reviews (all)…", flush=True)
-                fileobj = tf.extractfile(member)
-                if fileobj is None:
-                    raise RuntimeError("Failed to read review file from archive.")
-
-                for r in _iter_jsonl_dicts(fileobj):
-                    business_id = _normalize_str(r.get("business_id"))
-                    if business_id not in business_id_set:
-                        continue
-
-                    date_field = _normalize_str(r.get("date"))
-                    if not date_field:
-                        continue
-                    try:
-                        dt = datetime.fromisoformat(date_field)
-                    except ValueError:
-                        continue
-                    month_key = dt.strftime("%Y-%m")
-                    review_month_counts[month_key] += 1
-
-                    stars = int(r.get("stars", 0) or 0)
-                    if 1 <= stars <= 5:
-                        review_star_counts[stars] += 1
-
-                    text = _normalize_str(r.get("text"))
-                    ln = len(text)
-                    review_lengths.append(ln)
-                    if 1 <= stars <= 5:
-                        review_lengths_by_star[stars].append(ln)
-
-                    vote_useful.append(max(0, int(r.get("useful", 0) or 0)))
-                    vote_funny.append(max(0, int(r.get("funny", 0) or 0)))
-                    vote_cool.append(max(0, int(r.get("cool", 0) or 0)))
-
-                    reviews_counted += 1
-                    if args.max_reviews > 0 and reviews_counted >= args.max_reviews:
-                        break
-
-                fileobj.close()
+            elif kind == "review":
+                review = job.get()
+                review_month_counts = review.month_counts
+                review_stars = review.stars
+                review_lengths = review.lengths
+                vote_useful = review.useful
+                vote_funny = review.funny
+                vote_cool = review.cool
+                reviews_counted = review.counted
+
+                # Per-star tallies in one vectorized pass instead of dict updates per review.
+                review_stars_np = _np_view(review_stars, np.uint8)
+                lengths = _np_view(review_lengths, np.uint32)
+                review_star_counts = np.bincount(review_stars_np, minlength=6)
+                review_lengths_by_star = {s: lengths[review_stars_np == s] for s in range(1, 6)}
 
                 if reviews_counted > 0:
                     # 20 Review volume over time (month)
-                    series = (
-                        pd.Series(review_month_counts)
-                        .rename_axis("month")
-                        .reset_index(name="reviews")
-                        .sort_values("month")
-                    )
-                    series["month_dt"] = pd.to_datetime(series["month"], format="%Y-%m")
+                    month_dt, month_n = _month_series(review_month_counts)
 
-                    fig, ax = plt.subplots(figsize=(12, 4.5))
-                    ax.plot(series["month_dt"], series["reviews"], linewidth=2)
+                    fig, ax = _get_fig((12, 4.5))
+                    ax.plot(month_dt, month_n, linewidth=2)
                     ax.set_title("How has review volume changed over time? (reviews per month)")
                     ax.set_xlabel("Month")
                     ax.set_ylabel("Number of reviews")
@@ -934,10 +1713,10 @@ def main() -> int:
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("20_reviews_over_time.png", ax.get_title(), notes=f"{reviews_counted:,} reviews (filtered; {cap_note})")))
 
                     # 21 Review stars distribution
-                    fig, ax = plt.subplots(figsize=(8, 4.5))
+                    fig, ax = _get_fig((8, 4.5))
                     keys = [1,2,3,4,5]
-                    vals = [review_star_counts.get(k, 0) for k in keys]
-                    colors = sns.color_palette("RdYlGn", n_colors=5)
+                    vals = [int(review_star_counts[k]) for k in keys]
+                    colors = _palette("RdYlGn", 5)
                     bars = ax.bar([str(k) for k in keys], vals, color=colors)
                     total = sum(vals) or 1
                     for bar, val in zip(bars, vals):
@@ -949,9 +1728,8 @@ def main() -> int:
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("21_review_star_distribution.png", ax.get_title())))
 
                     # 22 Review length distribution
-                    fig, ax = plt.subplots(figsize=(8, 4.5))
-                    lengths = _np_view(review_lengths, np.uint32)
-                    clip_val = int(np.quantile(lengths, 0.99)) if lengths.size > 50 else int(lengths.max())
+                    fig, ax = _get_fig((8, 4.5))
+                    clip_val = int(_quantile(lengths, 0.99)) if lengths.size > 50 else int(lengths.max())
                     clipped = np.minimum(lengths, clip_val)
                     sns.histplot(clipped, bins=50, ax=ax, edgecolor="white", linewidth=0.25)
                     ax.set_title("How long are reviews? (characters; 99th percentile clipped)")
@@ -961,16 +1739,15 @@ def main() -> int:
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("22_review_length_distribution.png", ax.get_title(), notes=f"clipped at p99={clip_val:,} chars")))
 
                     # 23 Review length vs stars (box)
-                    stats = []
-                    for s in [1, 2, 3, 4, 5]:
-                        arr = _np_view(review_lengths_by_star[s], np.uint32)
-                        if arr.size == 0:
-                            continue
-                        stats.append(_box_stats(np.minimum(arr, clip_val), label=str(s)))
+                    present = [s for s in [1, 2, 3, 4, 5] if review_lengths_by_star[s].size]
+                    stats = _box_stats_many(
+                        [np.minimum(review_lengths_by_star[s], clip_val) for s in present],
+                        [str(s) for s in present],
+                    )
                     if stats:
-                        fig, ax = plt.subplots(figsize=(9, 4.8))
+                        fig, ax = _get_fig((9, 4.8))
                         bxp = ax.bxp(stats, showfliers=False, patch_artist=True)
-                        colors = sns.color_palette("rocket_r", n_colors=len(stats))
+                        colors = _palette("rocket_r", len(stats))
                         for patch, color in zip(bxp["boxes"], colors):
                             patch.set_facecolor(color)
                             patch.set_alpha(0.9)
@@ -990,19 +1767,18 @@ def main() -> int:
                     cool = _np_view(vote_cool, np.uint32)
                     clip_votes = int(
                         max(
-                            np.quantile(useful, 0.995) if useful.size > 50 else useful.max(),
-                            np.quantile(funny, 0.995) if funny.size > 50 else funny.max(),
-                            np.quantile(cool, 0.995) if cool.size > 50 else cool.max(),
+                            _quantile(useful, 0.995) if useful.size > 50 else useful.max(),
+                            _quantile(funny, 0.995) if funny.size > 50 else funny.max(),
+                            _quantile(cool, 0.995) if cool.size > 50 else cool.max(),
                         )
                     )
-                    stats = [
-                        _box_stats(np.minimum(useful, clip_votes), label="useful"),
-                        _box_stats(np.minimum(funny, clip_votes), label="funny"),
-                        _box_stats(np.minimum(cool, clip_votes), label="cool"),
-                    ]
-                    fig, ax = plt.subplots(figsize=(9, 4.8))
+                    stats = _box_stats_many(
+                        [np.minimum(useful, clip_votes), np.minimum(funny, clip_votes), np.minimum(cool, clip_votes)],
+                        ["useful", "funny", "cool"],
+                    )
+                    fig, ax = _get_fig((9, 4.8))
                     bxp = ax.bxp(stats, showfliers=False, patch_artist=True)
-                    colors = sns.color_palette("crest", n_colors=3)
+                    colors = _palette("crest", 3)
                     for patch, color in zip(bxp["boxes"], colors):
                         patch.set_facecolor(color)
                         patch.set_alpha(0.9)
@@ -1017,40 +1793,20 @@ def main() -> int:
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("24_review_votes_boxplot.png", ax.get_title(), notes=f"clipped at p99.5={clip_votes:,} votes")))
 
             # ------------- USERS -------------
-            elif name == "yelp_academic_dataset_user.json" and args.max_users != 0:
-                if args.max_users > 0:
-                    print(f"Parsing users (up to {args.max_users:,})…", flush=True)
-                else:
-                    print("Parsing users (all)…", flush=True)
-                fileobj = tf.extractfile(member)
-                if fileobj is None:
-                    raise RuntimeError("Failed to read user file from archive.")
-
-                for u in _iter_jsonl_dicts(fileobj):
-                    ys = _normalize_str(u.get("yelping_since"))
-                    if ys:
-                        try:
-                            join_year = datetime.fromisoformat(ys).year
-                            user_join_year_counts[join_year] += 1
-                        except ValueError:
-                            pass
-
-                    user_review_counts.append(max(0, int(u.get("review_count", 0) or 0)))
-                    user_fans_counts.append(max(0, int(u.get("fans", 0) or 0)))
-                    user_avg_stars.append(float(_safe_float(u.get("average_stars"))))
-
-                    users_counted += 1
-                    if args.max_users > 0 and users_counted >= args.max_users:
-                        break
-
-                fileobj.close()
+            elif kind == "user":
+                user = job.get()
+                user_join_year_counts = user.join_year_counts
+                user_review_counts = user.review_counts
+                user_fans_counts = user.fans_counts
+                user_avg_stars = user.avg_stars
+                users_counted = user.counted
 
                 if users_counted > 0:
                     # 25 Join year distribution
                     if user_join_year_counts:
                         years = sorted(user_join_year_counts.keys())
                         counts = [user_join_year_counts[y] for y in years]
-                        fig, ax = plt.subplots(figsize=(12, 4.5))
+                        fig, ax = _get_fig((12, 4.5))
                         ax.plot(years, counts, marker="o")
                         ax.set_title("When did users join Yelp? (join year from yelping_since)")
                         ax.set_xlabel("Join year")
@@ -1060,10 +1816,9 @@ def main() -> int:
                         specs.append(_plot_and_save(fig, args.out, ChartSpec("25_user_join_years.png", ax.get_title(), notes=f"{users_counted:,} users ({cap_note})")))
 
                     # 26 User review_count distribution (symlog)
-                    fig, ax = plt.subplots(figsize=(8, 4.5))
+                    fig, ax = _get_fig((8, 4.5))
                     rc = _np_view(user_review_counts, np.uint32)
-                    bins = np.unique(np.logspace(0, math.log10(max(1, rc.max())), 40).astype(int))
-                    bins = np.r_[0, bins]
+                    bins = _log_int_bins(rc.max(), 40)
                     ax.hist(rc, bins=bins)
                     ax.set_xscale("symlog", linthresh=10)
                     ax.set_title("What is the distribution of user review counts? (symlog scale)")
@@ -1073,10 +1828,9 @@ def main() -> int:
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("26_user_reviewcount_distribution.png", ax.get_title())))
 
                     # 27 Fans distribution (symlog)
-                    fig, ax = plt.subplots(figsize=(8, 4.5))
+                    fig, ax = _get_fig((8, 4.5))
                     fans = _np_view(user_fans_counts, np.uint32)
-                    bins = np.unique(np.logspace(0, math.log10(max(1, fans.max())), 40).astype(int))
-                    bins = np.r_[0, bins]
+                    bins = _log_int_bins(fans.max(), 40)
                     ax.hist(fans, bins=bins)
                     ax.set_xscale("symlog", linthresh=5)
                     ax.set_title("What is the distribution of user fan counts? (symlog scale)")
@@ -1086,7 +1840,7 @@ def main() -> int:
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("27_user_fans_distribution.png", ax.get_title())))
 
                     # 28 Average stars distribution
-                    fig, ax = plt.subplots(figsize=(8, 4.5))
+                    fig, ax = _get_fig((8, 4.5))
                     avg = _np_view(user_avg_stars, np.float32)
                     avg = avg[np.isfinite(avg)]
                     sns.histplot(avg, bins=30, ax=ax, edgecolor="white", linewidth=0.25)
@@ -1097,47 +1851,18 @@ def main() -> int:
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("28_user_average_stars_distribution.png", ax.get_title())))
 
             # ------------- TIPS -------------
-            elif name == "yelp_academic_dataset_tip.json" and args.max_tips != 0:
-                if business_id_set is None:
-                    raise RuntimeError("Expected to parse business file before tips (needed for filtering).")
-                if args.max_tips > 0:
-                    print(f"Parsing tips (up to {args.max_tips:,})…", flush=True)
-                else:
-                    print("Parsing tips (all)…", flush=True)
-                fileobj = tf.extractfile(member)
-                if fileobj is None:
-                    raise RuntimeError("Failed to read tip file from archive.")
-
-                for t in _iter_jsonl_dicts(fileobj):
-                    business_id = _normalize_str(t.get("business_id"))
-                    if not business_id or business_id not in business_id_set:
-                        continue
-                    date_field = _normalize_str(t.get("date"))
-                    if date_field:
-                        try:
-                            dt = datetime.fromisoformat(date_field)
-                            tip_month_counts[dt.strftime("%Y-%m")] += 1
-                        except ValueError:
-                            pass
-                    tip_compliments.append(max(0, int(t.get("compliment_count", 0) or 0)))
-                    tips_counted += 1
-                    if args.max_tips > 0 and tips_counted >= args.max_tips:
-                        break
-
-                fileobj.close()
+            elif kind == "tip":
+                tip = job.get()
+                tip_month_counts = tip.month_counts
+                tip_compliments = tip.compliments
+                tips_counted = tip.counted
 
                 if tips_counted > 0:
                     # 29 Tip volume over time
                     if tip_month_counts:
-                        series = (
-                            pd.Series(tip_month_counts)
-                            .rename_axis("month")
-                            .reset_index(name="tips")
-                            .sort_values("month")
-                        )
-                        series["month_dt"] = pd.to_datetime(series["month"], format="%Y-%m")
-                        fig, ax = plt.subplots(figsize=(12, 4.5))
-                        ax.plot(series["month_dt"], series["tips"], linewidth=2)
+                        month_dt, month_n = _month_series(tip_month_counts)
+                        fig, ax = _get_fig((12, 4.5))
+                        ax.plot(month_dt, month_n, linewidth=2)
                         ax.set_title("How has tip volume changed over time? (tips per month)")
                         ax.set_xlabel("Month")
                         ax.set_ylabel("Tips")
@@ -1149,10 +1874,9 @@ def main() -> int:
                         specs.append(_plot_and_save(fig, args.out, ChartSpec("29_tips_over_time.png", ax.get_title(), notes=f"{tips_counted:,} tips ({cap_note})")))
 
                     # 30 Tip compliments distribution
-                    fig, ax = plt.subplots(figsize=(8, 4.5))
+                    fig, ax = _get_fig((8, 4.5))
                     cc = _np_view(tip_compliments, np.uint32)
-                    bins = np.unique(np.logspace(0, math.log10(max(1, cc.max())), 35).astype(int))
-                    bins = np.r_[0, bins]
+                    bins = _log_int_bins(cc.max(), 35)
                     ax.hist(cc, bins=bins)
                     ax.set_xscale("symlog", linthresh=2)
                     ax.set_title("What is the distribution of tip compliment counts? (symlog scale)")
@@ -1161,28 +1885,15 @@ def main() -> int:
                     _format_large_number_axis(ax, "y")
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("30_tip_compliments_distribution.png", ax.get_title())))
 
-            # ------------- PHOTOS (optional; may not be in Yelp-JSON.tar) -------------
-            elif name == "yelp_academic_dataset_photo.json" and args.max_photos > 0:
-                if business_id_set is None:
-                    raise RuntimeError("Expected to parse business file before photos (needed for filtering).")
-                print(f"Sampling up to {args.max_photos:,} photos…", flush=True)
-                fileobj = tf.extractfile(member)
-                if fileobj is None:
-                    raise RuntimeError("Failed to read photo file from archive.")
-                for p in _iter_jsonl_dicts(fileobj):
-                    business_id = _normalize_str(p.get("business_id"))
-                    if not business_id or business_id not in business_id_set:
-                        continue
-                    label = _normalize_str(p.get("label")) or "Unknown"
-                    photo_label_counts[label] += 1
-                    photos_counted += 1
-                    if photos_counted >= args.max_photos:
-                        break
-                fileobj.close()
+            # ------------- PHOTOS -------------
+            elif kind == "photo":
+                photo = job.get()
+                photo_label_counts = photo.label_counts
+                photos_counted = photo.counted
 
                 if photos_counted > 0:
                     labels, counts = zip(*photo_label_counts.most_common())
-                    fig, ax = plt.subplots(figsize=(8, 4.5))
+                    fig, ax = _get_fig((8, 4.5))
                     ax.bar(labels, counts)
                     ax.set_title("What photo labels are present in the dataset? (photo.json)")
                     ax.set_xlabel("Photo label")
@@ -1190,13 +1901,11 @@ def main() -> int:
                     _format_large_number_axis(ax, "y")
                     specs.append(_plot_and_save(fig, args.out, ChartSpec("31_photo_label_distribution.png", ax.get_title())))
 
-        # End loop over tar members
-
         if not specs:
             raise RuntimeError("Did not generate any charts — did the dataset files exist in the zip?")
 
         context_lines = [
-            f"Businesses selected: {len(business_rows):,}",
+            f"Businesses selected: {len(b_id):,}",
             f"Filters: states={sorted(states) if states else '∅'}, cities={sorted(cities) if cities else '∅'}, category substrings={category_substrings if category_substrings else '∅'}",
             f"Check-ins counted: {checkins_total:,}" if not args.no_checkins else "Check-ins: skipped",
             "Reviews: skipped"
@@ -1212,12 +1921,18 @@ def main() -> int:
         if args.max_photos > 0:
             context_lines.append(f"Photos counted: {photos_counted:,} (max_photos={args.max_photos:,})")
 
+        _wait_for_saves()
         _write_manifest(args.out, specs, context_lines)
         print(f"Wrote {len(specs)} figures to: {args.out}")
         print(f"Manifest: {args.out / 'manifest.md'}")
         return 0
 
     finally:
+        _RENDER["pool"] = None
+        pool.terminate()
+        pool.join()
+        spool_dir.cleanup()
+        _close_figures()
         _close_tar_chain(tf)
 
 
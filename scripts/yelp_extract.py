@@ -3,13 +3,94 @@
 from __future__ import annotations
 
 import argparse
+import io
 import os
-import shutil
-import tarfile
+import struct
+import sys
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    # rapidgzip inflates disjoint regions of one gzip stream on a thread pool. It needs a
+    # seekable source, which a stored (uncompressed) zip member gives us without a temp copy.
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+try:
+    # Python binding for Linux io_uring; only used with --io-uring.
+    import liburing
+except ImportError:
+    liburing = None
+
+# Chunk size for the archive → file copies.
+_COPY_BUFSIZE = 4 * 1024 * 1024
+# Small-file writes queued on the writer threads before the reader waits for the oldest.
+_MAX_PENDING_WRITES = 64
+# Read size for the decompressed tar stream. Small chunks stay in cache and reuse
+# allocations; 4 MiB inflate outputs measured ~25% slower.
+_INFLATE_CHUNK = 64 * 1024
+
+_TAR_BLOCK = 512
+_TAR_END_BLOCK = bytes(_TAR_BLOCK)
+# Typeflags of members with file data, and of members whose size field is not followed by data.
+_TAR_FILE_TYPES = (b"0", b"\0", b"7")
+_TAR_NO_DATA_TYPES = (b"1", b"2", b"3", b"4", b"5", b"6")
+# Extended-header records that describe the member after them (GNU long names, pax).
+_TAR_META_TYPES = (b"L", b"K", b"x", b"X", b"g")
+
+
+class _UringWriter:
+    """Write whole small files through an io_uring submission queue, keeping up to `depth`
+    writes in flight from the reader thread. Files are opened here and closed on completion."""
+
+    def __init__(self, depth: int) -> None:
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(depth, self._ring, 0)
+        self._depth = depth
+        # user_data → (fd, data, path); `data` must stay alive until its write completes.
+        self._inflight: dict[int, tuple[int, bytes, str]] = {}
+        self._next_id = 0
+
+    def write_bytes(self, path: str, data: bytes) -> None:
+        if len(self._inflight) >= self._depth:
+            self._reap()
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        liburing.io_uring_prep_write(sqe, fd, data)
+        liburing.io_uring_sqe_set_data64(sqe, self._next_id)
+        self._inflight[self._next_id] = (fd, data, path)
+        self._next_id += 1
+        liburing.io_uring_submit(self._ring)
+
+    def _reap(self) -> None:
+        liburing.io_uring_wait_cqe(self._ring, self._cqe)
+        cqe = self._cqe[0]
+        res, user_data = cqe.res, cqe.user_data
+        liburing.io_uring_cqe_seen(self._ring, cqe)
+        fd, data, path = self._inflight.pop(user_data)
+        try:
+            if res < 0:
+                raise OSError(-res, os.strerror(-res), path)
+            # Short writes are rare on regular files; finish them synchronously.
+            while res < len(data):
+                res += os.pwrite(fd, memoryview(data)[res:], res)
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        try:
+            while self._inflight:
+                self._reap()
+        finally:
+            liburing.io_uring_queue_exit(self._ring)
+
 
 @dataclass(frozen=True)
 class ExtractResult:
@@ -18,105 +99,364 @@ class ExtractResult:
     extracted_bytes: int
 
 
-def _safe_join(root: Path, member_name: str) -> Path:
+def _safe_join(root: str, member_name: str) -> str:
+    # Plain strings: building a Path per member is measurable over ~200k photos.
     normalized = member_name.replace("\\", "/")
     parts = [p for p in normalized.split("/") if p not in ("", ".")]
     if any(p == ".." for p in parts):
         raise ValueError(f"Unsafe member path: {member_name}")
-    return root.joinpath(*parts)
+    return os.path.join(root, *parts)
 
 
-def _extract_zip_pdfs(zip_path: Path, docs_dir: Path, prefix: str) -> int:
-    extracted = 0
-    docs_dir.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(zip_path) as z:
-        for info in z.infolist():
-            if info.is_dir():
-                continue
-            if info.filename.startswith("__MACOSX/"):
-                continue
-            if not info.filename.lower().endswith(".pdf"):
-                continue
-            out_path = docs_dir / f"{prefix}_{Path(info.filename).name}"
-            if out_path.exists() and out_path.stat().st_size == info.file_size:
-                continue
-            with z.open(info) as src, out_path.open("wb") as dst:
-                shutil.copyfileobj(src, dst, length=1024 * 1024)
-            extracted += 1
-    return extracted
-
-
-def _open_gzipped_tar_inside_zip(zip_path: Path, tar_suffix: str) -> tarfile.TarFile:
-    zip_file = zipfile.ZipFile(zip_path)
-    try:
-        tar_members = [
-            info
-            for info in zip_file.infolist()
-            if info.filename.lower().endswith(tar_suffix.lower())
-            and not info.filename.startswith("__MACOSX/")
-        ]
-        if not tar_members:
-            raise FileNotFoundError(
-                f"Could not find {tar_suffix} inside {zip_path}."
-            )
-        tar_stream = zip_file.open(tar_members[0])
-    except Exception:
-        zip_file.close()
-        raise
+def _file_sizes(directory: str | Path) -> dict[str, int]:
+    """Map file name → size for `directory`, from one scandir pass instead of a stat per member."""
+    with os.scandir(directory) as entries:
+        return {e.name: e.stat().st_size for e in entries if e.is_file()}
 
-    tf = tarfile.open(fileobj=tar_stream, mode="r|gz")
-    tf._codex_zip_file = zip_file  # type: ignore[attr-defined]
-    tf._codex_tar_stream = tar_stream  # type: ignore[attr-defined]
-    return tf
 
+def _fadvise(fileobj, advice_name: str) -> None:
+    """Best-effort page-cache hint for the whole file; a no-op without posix_fadvise."""
+    advice = getattr(os, advice_name, None)
+    if advice is not None and hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fileobj.fileno(), 0, 0, advice)
 
-def _close_tar_chain(tf: tarfile.TarFile) -> None:
-    tar_stream = getattr(tf, "_codex_tar_stream", None)
-    zip_file = getattr(tf, "_codex_zip_file", None)
-    try:
-        tf.close()
-    finally:
-        if tar_stream is not None:
-            tar_stream.close()
-        if zip_file is not None:
-            zip_file.close()
 
+def _write_file(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
 
-def _extract_tar_stream(tf: tarfile.TarFile, out_root: Path, *, max_files: int) -> ExtractResult:
-    extracted_files = 0
-    skipped_files = 0
-    extracted_bytes = 0
 
-    out_root.mkdir(parents=True, exist_ok=True)
-
-    for member in tf:
-        if max_files > 0 and extracted_files >= max_files:
+def _copy_readinto(src, dst, buf: memoryview) -> None:
+    """Copy `src` to `dst` through one reusable buffer (no per-chunk bytes allocation)."""
+    readinto, write = src.readinto, dst.write
+    while True:
+        n = readinto(buf)
+        if not n:
             break
+        write(buf[:n])
 
-        if member.isdir():
-            _safe_join(out_root, member.name).mkdir(parents=True, exist_ok=True)
-            continue
 
-        if not member.isfile():
+def _extract_pdfs_and_find_tar(
+    zip_file: zipfile.ZipFile, docs_dir: Path, prefix: str, tar_suffix: str
+) -> zipfile.ZipInfo:
+    """Extract the PDFs from `zip_file` into `docs_dir` and return the tar member, in one
+    pass over the central directory."""
+    tar_info: zipfile.ZipInfo | None = None
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    buf = memoryview(bytearray(_COPY_BUFSIZE))
+    existing = _file_sizes(docs_dir)
+    for info in zip_file.infolist():
+        if info.is_dir():
             continue
-
-        out_path = _safe_join(out_root, member.name)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if out_path.exists() and out_path.stat().st_size == member.size:
-            skipped_files += 1
+        if info.filename.startswith("__MACOSX/"):
             continue
-
-        src = tf.extractfile(member)
-        if src is None:
+        name = info.filename.lower()
+        if tar_info is None and name.endswith(tar_suffix.lower()):
+            tar_info = info
+            continue
+        if not name.endswith(".pdf"):
             continue
-        with src, out_path.open("wb") as dst:
-            shutil.copyfileobj(src, dst, length=1024 * 1024)
-        extracted_files += 1
-        extracted_bytes += int(member.size or 0)
+        out_name = f"{prefix}_{Path(info.filename).name}"
+        if existing.get(out_name) == info.file_size:
+            continue
+        with zip_file.open(info) as src, (docs_dir / out_name).open("wb") as dst:
+            _copy_readinto(src, dst, buf)
+        existing[out_name] = info.file_size
+    if tar_info is None:
+        raise FileNotFoundError(f"Could not find {tar_suffix} inside {zip_file.filename}.")
+    return tar_info
+
+
+class _StoredMemberReader(io.RawIOBase):
+    """Seekable, unbuffered reader over the raw bytes of a stored (uncompressed) zip member."""
+
+    def __init__(self, zip_path: Path, info: zipfile.ZipInfo) -> None:
+        super().__init__()
+        self._file = open(zip_path, "rb", buffering=0)
+        _fadvise(self._file, "POSIX_FADV_SEQUENTIAL")
+        # Data starts after the local file header (30 bytes + name + extra field).
+        self._file.seek(info.header_offset)
+        header = self._file.read(30)
+        name_len, extra_len = struct.unpack("<HH", header[26:30])
+        self._start = info.header_offset + 30 + name_len + extra_len
+        self._size = info.compress_size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        n = min(len(buffer), self._size - self._pos)
+        if n <= 0:
+            return 0
+        self._file.seek(self._start + self._pos)
+        n = self._file.readinto(memoryview(buffer)[:n]) or 0
+        self._pos += n
+        return n
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def _tar_number(field: bytes) -> int:
+    if field[0] in (0o200, 0o377):
+        # GNU base-256 (used for sizes of 8 GiB and up).
+        n = int.from_bytes(field[1:], "big")
+        return n - 256 ** (len(field) - 1) if field[0] == 0o377 else n
+    try:
+        return int(field.split(b"\0", 1)[0].strip() or b"0", 8)
+    except ValueError:
+        raise ValueError("Invalid tar header.") from None
+
+
+def _tar_text(field: bytes) -> str:
+    return field.split(b"\0", 1)[0].decode("utf-8", "surrogateescape")
+
+
+def _tar_checksum_ok(header: bytes) -> bool:
+    # The checksum field itself counts as eight spaces; some tars sum signed bytes.
+    stored = _tar_number(header[148:156])
+    if stored == 256 + sum(header) - sum(header[148:156]):
+        return True
+    return stored == 256 + sum(struct.unpack_from("148b8x356b", header))
+
+
+def _parse_pax(data: bytes) -> dict[str, str]:
+    records: dict[str, str] = {}
+    pos = 0
+    while pos < len(data) and data[pos] != 0:
+        space = data.index(b" ", pos)
+        length = int(data[pos:space])
+        key, _, value = data[space + 1 : pos + length - 1].partition(b"=")
+        records[key.decode("utf-8")] = value.decode("utf-8", "surrogateescape")
+        pos += length
+    return records
+
+
+class _TarReader:
+    """Streaming reader for ustar / GNU / pax tar archives.
+
+    tarfile builds a TarInfo per header in Python, which dominates on the ~200k-photo tar.
+    Iterating this yields `(name, typeflag, size)`; read the member's data with read_data()
+    or copy_data() before advancing (anything left unread is skipped).
+    """
+
+    def __init__(self, fileobj) -> None:
+        self._read = fileobj.read
+        self._readinto = fileobj.readinto
+        self._remaining = 0
+        self._padding = 0
+        self._global_pax: dict[str, str] = {}
+        self._skip_buf = memoryview(bytearray(_INFLATE_CHUNK))
+
+    def __iter__(self) -> _TarReader:
+        return self
+
+    def __next__(self) -> tuple[str, bytes, int]:
+        self._skip(self._remaining + self._padding)
+        self._remaining = self._padding = 0
+        long_name: str | None = None
+        pax: dict[str, str] = {}
+        while True:
+            header = self._read(_TAR_BLOCK)
+            if not header or header == _TAR_END_BLOCK:
+                raise StopIteration
+            if len(header) < _TAR_BLOCK:
+                raise ValueError("Unexpected end of tar data.")
+            if not _tar_checksum_ok(header):
+                raise ValueError("Invalid tar header (bad checksum).")
+            typeflag = header[156:157]
+            size = _tar_number(header[124:136])
+            if typeflag not in _TAR_META_TYPES:
+                break
+            data = self._read_exact(size)
+            self._skip(-size % _TAR_BLOCK)
+            if typeflag == b"L":
+                long_name = _tar_text(data)
+            elif typeflag == b"g":
+                self._global_pax.update(_parse_pax(data))
+            elif typeflag != b"K":
+                pax.update(_parse_pax(data))
+
+        # Same name rules as tarfile: V7 directories end in "/", ustar splits off a prefix.
+        name = _tar_text(header[:100])
+        if typeflag == b"\0" and name.endswith("/"):
+            typeflag = b"5"
+        if typeflag == b"5":
+            name = name.rstrip("/")
+        prefix = _tar_text(header[345:500])
+        if prefix and typeflag != b"S":
+            name = prefix + "/" + name
+        if long_name is not None:
+            name = long_name
+        if self._global_pax:
+            pax = {**self._global_pax, **pax}
+        if "path" in pax:
+            name = pax["path"]
+        if "size" in pax:
+            size = int(pax["size"])
+        if typeflag == b"S":
+            raise ValueError(f"GNU sparse tar members are not supported: {name}")
+
+        if typeflag not in _TAR_NO_DATA_TYPES:
+            self._remaining = size
+            self._padding = -size % _TAR_BLOCK
+        return name, typeflag, size
+
+    def read_data(self) -> bytes:
+        data = self._read_exact(self._remaining)
+        self._remaining = 0
+        return data
+
+    def copy_data(self, dst, buf: memoryview) -> None:
+        readinto, write = self._readinto, dst.write
+        while self._remaining:
+            n = readinto(buf[: min(len(buf), self._remaining)])
+            if not n:
+                raise ValueError("Unexpected end of tar data.")
+            write(buf[:n])
+            self._remaining -= n
+
+    def _read_exact(self, size: int) -> bytes:
+        data = self._read(size)
+        if len(data) < size:
+            raise ValueError("Unexpected end of tar data.")
+        return data
+
+    def _skip(self, size: int) -> None:
+        buf = self._skip_buf
+        while size:
+            n = self._readinto(buf[: min(len(buf), size)])
+            if not n:
+                raise ValueError("Unexpected end of tar data.")
+            size -= n
+
+
+class _InflateReader(io.RawIOBase):
+    """Raw reader that gunzips `fileobj` without gzip.GzipFile's per-8-KiB Python overhead."""
+
+    def __init__(self, fileobj) -> None:
+        super().__init__()
+        self._fp = fileobj
+        # wbits=MAX_WBITS|16: zlib parses the gzip header and checks the CRC/size trailer.
+        self._inflater = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        self._input = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        # Like tarfile's own gz stream, only the first gzip member is read.
+        inflater = self._inflater
+        while not inflater.eof:
+            if not self._input:
+                self._input = self._fp.read(_INFLATE_CHUNK)
+                if not self._input:
+                    raise ValueError("Unexpected end of tar data.")
+            data = inflater.decompress(self._input, len(buffer))
+            self._input = inflater.unconsumed_tail
+            if data:
+                n = len(data)
+                buffer[:n] = data
+                return n
+        return 0
+
+
+def _open_gzipped_tar_inside_zip(
+    zip_file: zipfile.ZipFile, zip_path: Path, info: zipfile.ZipInfo, stack: ExitStack
+):
+    """Return the decompressed tar stream of `info`; everything opened is closed by `stack`."""
+    if rapidgzip is not None and info.compress_type == zipfile.ZIP_STORED:
+        # Parallel inflate straight from the zip file. Like _InflateReader, rapidgzip is a raw
+        # stream, so it is buffered to keep the 512-byte header reads cheap.
+        raw_stream = stack.enter_context(_StoredMemberReader(zip_path, info))
+        gz_stream = stack.enter_context(
+            rapidgzip.open(raw_stream, parallelization=os.cpu_count() or 1)
+        )
+        return stack.enter_context(io.BufferedReader(gz_stream, buffer_size=_INFLATE_CHUNK))
+    member = stack.enter_context(zip_file.open(info))
+    return stack.enter_context(
+        io.BufferedReader(_InflateReader(member), buffer_size=_INFLATE_CHUNK)
+    )
 
-        if extracted_files % 25 == 0:
-            print(f"… extracted {extracted_files:,} files", flush=True)
+
+def _extract_tar_stream(
+    tar_stream, out_root: Path, *, max_files: int, io_uring: bool = False
+) -> ExtractResult:
+    extracted_files = 0
+    skipped_files = 0
+    extracted_bytes = 0
+
+    out_root.mkdir(parents=True, exist_ok=True)
+    root = str(out_root)
+    # Directories created (and scanned) this run → their file sizes, for the skip check.
+    # Most members share a handful of parents.
+    dir_sizes: dict[str, dict[str, int]] = {}
+    buf = memoryview(bytearray(_COPY_BUFSIZE))
+    uring = _UringWriter(_MAX_PENDING_WRITES) if io_uring else None
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as writers:
+        pending: deque[Future] = deque()
+        try:
+            reader = _TarReader(tar_stream)
+            for member_name, typeflag, size in reader:
+                if max_files > 0 and extracted_files >= max_files:
+                    break
+
+                if typeflag == b"5":
+                    dir_path = _safe_join(root, member_name)
+                    if dir_path not in dir_sizes:
+                        os.makedirs(dir_path, exist_ok=True)
+                    continue
+
+                if typeflag not in _TAR_FILE_TYPES:
+                    continue
+
+                out_path = _safe_join(root, member_name)
+                parent, name = os.path.split(out_path)
+                sizes = dir_sizes.get(parent)
+                if sizes is None:
+                    os.makedirs(parent, exist_ok=True)
+                    sizes = dir_sizes[parent] = _file_sizes(parent)
+
+                if sizes.get(name) == size:
+                    skipped_files += 1
+                    continue
+
+                if uring is not None and size <= _COPY_BUFSIZE:
+                    uring.write_bytes(out_path, reader.read_data())
+                elif size <= _COPY_BUFSIZE:
+                    # Small members (photos): the tar stream can only be read on this thread,
+                    # but the open/write/close syscalls go to writer threads.
+                    pending.append(writers.submit(_write_file, out_path, reader.read_data()))
+                    if len(pending) >= _MAX_PENDING_WRITES:
+                        pending.popleft().result()
+                else:
+                    with open(out_path, "wb") as dst:
+                        reader.copy_data(dst, buf)
+                sizes[name] = size
+                extracted_files += 1
+                extracted_bytes += size
+
+                if extracted_files % 25 == 0:
+                    print(f"… extracted {extracted_files:,} files", flush=True)
+        finally:
+            # Surface any write error (and wait for the last files) before reporting.
+            while pending:
+                pending.popleft().result()
+            if uring is not None:
+                uring.close()
 
     return ExtractResult(
         extracted_files=extracted_files,
@@ -144,9 +484,19 @@ def main() -> int:
         default=0,
         help="If >0, stop after extracting this many files (useful for photos).",
     )
+    parser.add_argument(
+        "--io-uring",
+        action="store_true",
+        help="Write small files through io_uring (Linux, needs the liburing package).",
+    )
 
     args = parser.parse_args()
 
+    io_uring = args.io_uring
+    if io_uring and (liburing is None or not sys.platform.startswith("linux")):
+        print("--io-uring needs Linux and the liburing package; using threaded writes.")
+        io_uring = False
+
     out_dir = args.out
     docs_dir = out_dir / "docs"
     json_out = out_dir / "yelp_json"
@@ -158,15 +508,21 @@ def main() -> int:
         if not args.json_zip.exists():
             raise FileNotFoundError(f"Missing: {args.json_zip}")
 
-        print(f"Extracting docs from: {args.json_zip}")
-        _extract_zip_pdfs(args.json_zip, docs_dir, prefix="yelp_json")
+        with zipfile.ZipFile(args.json_zip) as zip_file:
+            _fadvise(zip_file.fp, "POSIX_FADV_SEQUENTIAL")
+            print(f"Extracting docs from: {args.json_zip}")
+            tar_info = _extract_pdfs_and_find_tar(
+                zip_file, docs_dir, prefix="yelp_json", tar_suffix="yelp_dataset.tar"
+            )
 
-        print(f"Extracting dataset tar from: {args.json_zip}")
-        tf = _open_gzipped_tar_inside_zip(args.json_zip, tar_suffix="yelp_dataset.tar")
-        try:
-            result = _extract_tar_stream(tf, json_out, max_files=args.max_files)
-        finally:
-            _close_tar_chain(tf)
+            print(f"Extracting dataset tar from: {args.json_zip}")
+            with ExitStack() as stack:
+                tar_stream = _open_gzipped_tar_inside_zip(zip_file, args.json_zip, tar_info, stack)
+                result = _extract_tar_stream(
+                    tar_stream, json_out, max_files=args.max_files, io_uring=io_uring
+                )
+            # The archive is read once; drop it so it does not evict the extracted files.
+            _fadvise(zip_file.fp, "POSIX_FADV_DONTNEED")
 
         print(
             f"JSON extracted: {result.extracted_files:,} files "
@@ -179,15 +535,21 @@ def main() -> int:
         if not args.photos_zip.exists():
             raise FileNotFoundError(f"Missing: {args.photos_zip}")
 
-        print(f"Extracting docs from: {args.photos_zip}")
-        _extract_zip_pdfs(args.photos_zip, docs_dir, prefix="yelp_photos")
+        with zipfile.ZipFile(args.photos_zip) as zip_file:
+            _fadvise(zip_file.fp, "POSIX_FADV_SEQUENTIAL")
+            print(f"Extracting docs from: {args.photos_zip}")
+            tar_info = _extract_pdfs_and_find_tar(
+                zip_file, docs_dir, prefix="yelp_photos", tar_suffix="yelp_photos.tar"
+            )
 
-        print(f"Extracting photos tar from: {args.photos_zip}")
-        tf = _open_gzipped_tar_inside_zip(args.photos_zip, tar_suffix="yelp_photos.tar")
-        try:
-            result = _extract_tar_stream(tf, photos_out, max_files=args.max_files)
-        finally:
-            _close_tar_chain(tf)
+            print(f"Extracting photos tar from: {args.photos_zip}")
+            with ExitStack() as stack:
+                tar_stream = _open_gzipped_tar_inside_zip(zip_file, args.photos_zip, tar_info, stack)
+                result = _extract_tar_stream(
+                    tar_stream, photos_out, max_files=args.max_files, io_uring=io_uring
+                )
+            # The archive is read once; drop it so it does not evict the extracted files.
+            _fadvise(zip_file.fp, "POSIX_FADV_DONTNEED")
 
         print(
             f"Photos extracted: {result.extracted_files:,} files "